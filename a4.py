@@ -1,130 +1,231 @@
-"""
-This module is basically the  structure of the user interface
-in which other modules and functions interact within the menu/choices to deliver
-the user experience. The main() function is the entry of the program's execution.
-
-
-Author: Ronan Almeida
-Student Number: 20178025
-Date: 2019-15-11
-"""
-
-# import all functions for use
-import collect_function_performance_data
-import counting_quad_sorts
-import file_chooser
-import file_column_averages
-import menu
-import plotter
-
-# Constants
-MAX_N = 100  # Maximum length of randomly generated lists
-NUM_TESTS = 100  # Number of tests to run on each chosen sort
-
-
-def main():
-    while True:  # main menu while loop
-        # Do menu choices
-        user_choice = menu.do_menu("Main Menu", ["Generate sort time files", "Plot average sort times"])
-        if user_choice is None:
-            break  # exit choice
-
-        print('\nValid choice:', user_choice)
-
-        if user_choice == 1:  # first menu choice - generate tests
-            while True:  # Sub menu
-                user_choice = menu.do_menu("Select a sort",
-                                           ["Bubble sort",
-                                            "Insertion Sort",
-                                            "Optimized bubble sort",
-                                            "Selection sort"])
-                if user_choice is None:
-                    break  # exit choice
-                print('\nValid choice:', user_choice)
-
-                if user_choice == 1:  # Generating test files  for bubble sort
-                    # Calling the data test function to generate the csv file
-                    print("\nGenerating test files.. for " + counting_quad_sorts.bubble_sort.__name__)
-                    collect_function_performance_data.test_function(counting_quad_sorts.bubble_sort, MAX_N, NUM_TESTS)
-                    print("\n" + counting_quad_sorts.bubble_sort.__name__ + ".csv generated")
-
-
-                elif user_choice == 2:  # Generating test files  for insertion sort
-                    # Calling the data test function to generate the csv file
-                    print("\nGenerating test files.. for " + counting_quad_sorts.insertion_sort.__name__)
-                    collect_function_performance_data.test_function(counting_quad_sorts.insertion_sort, MAX_N,
-                                                                    NUM_TESTS)
-                    print("\n" + counting_quad_sorts.insertion_sort.__name__ + ".csv generated")
-
-                elif user_choice == 3:  # Generating test files for optimized bubble sort
-                    # Calling the data test function to generate the csv file
-                    print("\nGenerating test files.. for " + counting_quad_sorts.opt_bubble_sort.__name__)
-                    collect_function_performance_data.test_function(counting_quad_sorts.opt_bubble_sort, MAX_N,
-                                                                    NUM_TESTS)
-                    print("\n" + counting_quad_sorts.opt_bubble_sort.__name__ + ".csv generated")
-
-
-                elif user_choice == 4:  # Generating test files for selection sort
-                    # Calling the data test function to generate the csv file
-                    print("\nGenerating test files.. for " + counting_quad_sorts.selection_sort.__name__)
-                    collect_function_performance_data.test_function(counting_quad_sorts.selection_sort, MAX_N,
-                                                                    NUM_TESTS)
-                    print("\n" + counting_quad_sorts.selection_sort.__name__ + ".csv generated")
-
-
-
-        elif user_choice == 2:  # 2nd menu choice plot average sort times
-            # n num of choices
-            while True:  # Sub menu
-                file_path = file_chooser.get_file_path_and_name(pattern='*.csv')  # file_path is a list of the csv files
-                if file_path is None:
-                    break  # exit choice
-
-                if file_path != None:  # if there exists a file(s) in file_path
-                    print('Path:', file_path[0])  # display its path
-                    print('File:', file_path[1])
-                    print('Both:', file_path[0] + "\\" + file_path[1])
-                    print("\nCalculating Averages for " + file_path[1])
-
-                    # Calculates the column averages for that particular csv file
-                    col_avg = file_column_averages.get_file_column_averages(file_path[1])
-
-                    print("\n Plotting Graph: " + file_path[1][:len(file_path[1]) - 4])
-
-                    # Plotting the graph of the averages
-
-                    # Setting up graph
-                    plot_graph = plotter.plot(title=file_path[1][:len(file_path[1]) - 4],
-                                              origin_x=15,
-                                              origin_y=15,
-                                              scale_x=6,
-                                              scale_y=0.11,
-                                              bg='darkseagreen1')
-
-                    plot_graph['draw_axes'](tick_length=4, tick_interval_y=100)  # set up axes
-
-                    # Plot each point by for loop
-                    for x in range(len(col_avg)):
-                        plot_graph['plot_point'](x, col_avg[x], 6
-                                                 , colour='red')  # color red
-
-                    # the n^2/2 function, commented out
-                    # plot_graph['plot_function'](lambda x: (x ** 2) / 2 if x >= 0 else None)
-                    # plot_graph['put_text']('T(n) = n^2/2', x=70, y=150, size=12, colour='black')
-
-                    # Labels T (100s), n, legend, t(n) = filename
-                    plot_graph['put_text']('T\n(100s)', 2, 5500, size=9, colour='Black')
-                    plot_graph['put_text']('n', 100, 100, size=9, colour='Black')
-                    plot_graph['put_text']('Legend:', x=70, y=450, size=12, colour='blue')
-                    plot_graph['put_text']('T(n) = ' + file_path[1][:len(file_path[1]) - 4], x=70, y=300, size=12,
-                                           colour='red')
-
-                    plot_graph['block']()  # Module exits when user closes the canvas window.
-
-
-main()
-
-
-
-if __name__ == '__main__':
-    print("Unit testing a4\n This is all print statements and while loops/menus ")
+"""
+This module is basically the  structure of the user interface
+in which other modules and functions interact within the menu/choices to deliver
+the user experience. The main() function is the entry of the program's execution.
+
+
+Author: Ronan Almeida
+Student Number: 20178025
+Date: 2019-15-11
+"""
+
+import os
+
+# import all functions for use
+import downsample
+import file_chooser
+import file_column_averages
+import file_column_statistics
+import menu
+import plotter
+import result_cache
+import sort_registry
+
+# Constants
+MAX_N = 100  # Maximum length of randomly generated lists
+NUM_TESTS = 100  # Number of tests to run on each chosen sort
+WORKERS = os.cpu_count()  # Number of processes the tests are spread over
+PLOT_ORIGIN_X = 15  # Pixels left of the y axis on the average sort times plot
+PLOT_ORIGIN_Y = 15  # Pixels below the x axis on the average sort times plot
+PLOT_SCALE_X = 6  # Default pixels per n of plot_series, the plots scale to the largest n
+# One colour per file of an overlay
+OVERLAY_COLOURS = ['red', 'blue', 'dark green', 'purple', 'orange', 'deep pink', 'navy', 'brown']
+SEED = 20191115  # Master seed of the tests, an unchanged experiment comes from the result cache
+
+
+def plot_series(plot_graph, series, width, origin_x=PLOT_ORIGIN_X, scale_x=PLOT_SCALE_X):
+    """
+    Draws each series of points on plot_graph, downsampled (largest-triangle-three-buckets)
+    to at most one point per pixel column of the visible part of the canvas, and painted as
+    one image item per series by plot_points rather than one oval per point.
+
+    Parameters:
+        plot_graph - the dict of functions returned by plotter.plot
+        series - a list of (points, diam, colour), points is a list of (x, y) pairs and diam
+            the size of each dot
+        width - the width of the canvas in pixels
+        origin_x, scale_x - the origin_x and scale_x the plot was made with
+
+    Returns:
+        items - the ids of the items drawn, so they can be deleted on a redraw
+    """
+    columns = max(int(width - origin_x), 3)  # pixel columns right of the y axis
+    items = []
+    for points, diam, colour in series:
+        visible = [point for point in points if point[0] * scale_x <= columns]
+        thin = downsample.lttb(visible, columns)
+        item = plot_graph['plot_points'](thin, diam, colour=colour, style='image')
+        if item is not None:  # nothing is drawn for an empty series
+            items.append(item)
+    return items
+
+
+def plot_overlay(file_paths):
+    """
+    Plots the column averages of several result files on one canvas, with shared axes and a
+    legend. The files are parsed at the same time, in a pool of worker processes.
+
+    Parameters:
+        file_paths - a list of (path, filename) tuples, from file_chooser.get_file_paths_and_names
+    """
+    names = [file_path[1] for file_path in file_paths]
+    print("\nCalculating Averages for " + ', '.join(names))
+    # each file's averages as (n, average) points, at the n recorded for each column
+    filenames = [os.path.join(path, name) for path, name in file_paths]
+    averages = file_column_averages.load_column_averages(filenames, positions=True)
+
+    # Shared axes: scale both so the longest and the highest series fit the canvas
+    # n counts from 0, so the longest series reaches its last n + 1
+    longest = max(max([points[-1][0] + 1 for points in averages if points], default=1), 1)
+    highest = max(max([max(y for x, y in points) for points in averages if points], default=1), 1)
+    usable = plotter.DEFAULT_CANV_WIDTH - 2 * PLOT_ORIGIN_X
+    scale_x = usable / longest
+    scale_y = usable / highest
+
+    plot_graph = plotter.plot(title='Overlay: ' + ', '.join(names),
+                              origin_x=PLOT_ORIGIN_X,
+                              origin_y=PLOT_ORIGIN_Y,
+                              scale_x=scale_x,
+                              scale_y=scale_y,
+                              bg='darkseagreen1')
+    plot_graph['draw_axes'](tick_length=4,
+                            tick_interval_x=max(1, round(longest / 20)),
+                            tick_interval_y=max(1, round(highest / 20)))
+
+    series = []
+    for i in range(len(averages)):
+        colour = OVERLAY_COLOURS[i % len(OVERLAY_COLOURS)]
+        series.append((averages[i], 4, colour))
+    drawn = plot_series(plot_graph, series, plotter.DEFAULT_CANV_WIDTH, PLOT_ORIGIN_X, scale_x)
+
+    def redraw(width, height):
+        plot_graph['delete'](*drawn)
+        drawn[:] = plot_series(plot_graph, series, width, PLOT_ORIGIN_X, scale_x)
+
+    plot_graph['on_resize'](redraw)
+
+    # Legend, top left, one line per file in its colour
+    plot_graph['put_text']('Legend:', x=longest * 0.05, y=highest * 0.95, size=12, colour='black')
+    for i in range(len(names)):
+        plot_graph['put_text']('T(n) = ' + os.path.splitext(names[i])[0],
+                               x=longest * 0.05, y=highest * (0.9 - 0.05 * i), size=12,
+                               colour=series[i][2])
+    plot_graph['put_text']('n', longest * 0.95, highest * 0.03, size=9, colour='Black')
+
+    plot_graph['block']()  # Returns when user closes the canvas window.
+
+
+def main():
+    while True:  # main menu while loop
+        # Do menu choices
+        user_choice = menu.do_menu("Main Menu", ["Generate sort time files", "Plot average sort times",
+                                                  "Clear result cache", "Overlay average sort times"])
+        if user_choice is None:
+            break  # exit choice
+
+        print('\nValid choice:', user_choice)
+
+        if user_choice == 1:  # first menu choice - generate tests
+            while True:  # Sub menu
+                sort_names = sort_registry.names()  # every registered sort is on the menu
+                titles = [sort_registry.title(name) for name in sort_names]
+                user_choice = menu.do_menu("Select a sort", titles)
+                if user_choice is None:
+                    break  # exit choice
+                print('\nValid choice:', user_choice)
+
+                # Calling the data test function to generate the csv file for the chosen sort
+                fn = sort_registry.get(sort_names[user_choice - 1])
+                print("\nGenerating test files.. for " + fn.__name__)
+                result_cache.cached_test_function(fn, MAX_N, NUM_TESTS, SEED, workers=WORKERS)
+                print("\n" + fn.__name__ + ".csv generated")
+
+        elif user_choice == 2:  # 2nd menu choice plot average sort times
+            # n num of choices
+            while True:  # Sub menu
+                file_path = file_chooser.get_file_path_and_name(pattern='*.csv')  # file_path is a list of the csv files
+                if file_path is None:
+                    break  # exit choice
+
+                if file_path != None:  # if there exists a file(s) in file_path
+                    print('Path:', file_path[0])  # display its path
+                    print('File:', file_path[1])
+                    print('Both:', file_path[0] + "\\" + file_path[1])
+                    print("\nCalculating Averages for " + file_path[1])
+
+                    # Calculates the column averages for that particular csv file
+                    col_avg = file_column_averages.get_file_column_averages(file_path[1])
+                    # and the spread of each column, for the error band
+                    col_stats = file_column_statistics.get_file_column_statistics(file_path[1])
+                    # and the n of each column, recorded in the file if it was run with a size schedule
+                    xs = file_column_averages.get_file_column_positions(file_path[1])
+                    xs = xs or range(len(col_avg))
+                    # pixels per n, so the largest n fits the canvas however far the schedule went
+                    longest = max(max(xs, default=0) + 1, 1)  # n counts from 0
+                    scale_x = (plotter.DEFAULT_CANV_WIDTH - 2 * PLOT_ORIGIN_X) / longest
+                    # and per count (or nanosecond), so the highest p90 or average fits it too
+                    highest = max([stats['p90'] for stats in col_stats] + list(col_avg) + [1])
+                    scale_y = (plotter.DEFAULT_CANV_HEIGHT - 2 * PLOT_ORIGIN_Y) / highest
+                    tick_y = max(1, round(highest / 20))
+
+                    print("\n Plotting Graph: " + file_path[1][:len(file_path[1]) - 4])
+
+                    # Plotting the graph of the averages
+
+                    # Setting up graph
+                    plot_graph = plotter.plot(title=file_path[1][:len(file_path[1]) - 4],
+                                              origin_x=PLOT_ORIGIN_X,
+                                              origin_y=PLOT_ORIGIN_Y,
+                                              scale_x=scale_x,
+                                              scale_y=scale_y,
+                                              bg='darkseagreen1')
+
+                    plot_graph['draw_axes'](tick_length=4, tick_interval_x=max(1, round(longest / 20)),
+                                            tick_interval_y=tick_y)  # set up axes
+
+                    # Error band: the min and the 90th percentile of each column, under the averages
+                    # in red. Each series is cut down to about one point per pixel column, and drawn
+                    # again whenever the window is resized.
+                    series = [([(xs[i], col_stats[i]['min']) for i in range(len(col_stats))], 3, 'pink'),
+                              ([(xs[i], col_stats[i]['p90']) for i in range(len(col_stats))], 3, 'pink'),
+                              ([(xs[i], col_avg[i]) for i in range(len(col_avg))], 6, 'red')]
+                    drawn = plot_series(plot_graph, series, plotter.DEFAULT_CANV_WIDTH,
+                                        PLOT_ORIGIN_X, scale_x)
+
+                    def redraw(width, height, plot_graph=plot_graph, series=series, drawn=drawn,
+                               scale_x=scale_x):
+                        plot_graph['delete'](*drawn)
+                        drawn[:] = plot_series(plot_graph, series, width, PLOT_ORIGIN_X, scale_x)
+
+                    plot_graph['on_resize'](redraw)
+
+                    # the n^2/2 function, commented out
+                    # plot_graph['plot_function'](lambda x: (x ** 2) / 2 if x >= 0 else None)
+                    # plot_graph['put_text']('T(n) = n^2/2', x=70, y=150, size=12, colour='black')
+
+                    # Labels T (in ticks), n, legend, t(n) = filename
+                    # (as fractions of the largest n and of the highest value)
+                    plot_graph['put_text']('T\n(' + str(tick_y) + 's)', longest * 0.02, highest * 0.98,
+                                           size=9, colour='Black')
+                    plot_graph['put_text']('n', longest, highest * 0.02, size=9, colour='Black')
+                    plot_graph['put_text']('Legend:', x=longest * 0.7, y=highest * 0.08, size=12, colour='blue')
+                    plot_graph['put_text']('T(n) = ' + file_path[1][:len(file_path[1]) - 4],
+                                           x=longest * 0.7, y=highest * 0.053, size=12, colour='red')
+                    plot_graph['put_text']('min to p90', x=longest * 0.7, y=highest * 0.027, size=12,
+                                           colour='pink')
+
+                    plot_graph['block']()  # Module exits when user closes the canvas window.
+
+        elif user_choice == 3:  # 3rd menu choice clear the result cache
+            print("\n" + str(result_cache.invalidate()) + " cached results removed")
+
+        elif user_choice == 4:  # 4th menu choice overlay several files on one plot
+            file_paths = file_chooser.get_file_paths_and_names(pattern='*.csv')
+            if file_paths is not None:
+                plot_overlay(file_paths)
+
+
+if __name__ == '__main__':
+    # main() only runs when a4 is the program, so worker processes can import this module safely
+    main()
+    print("Unit testing a4\n This is all print statements and while loops/menus ")
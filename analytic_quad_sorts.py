@@ -0,0 +1,271 @@
+"""
+This module is an alternate "analytic" engine for the counters in counting_quad_sorts.
+Each function here has the same name and the same contract as its counting_quad_sorts
+twin (it sorts items in place and returns the total count of passes), but the count is
+worked out from the inversions of items in O(n log n) instead of running the O(n^2) sort.
+
+- insertion_sort: (n - 1) + the number of inversions
+- bubble_sort / opt_bubble_sort: the number of passes is one more than the largest
+  left displacement, i.e. the most larger elements sitting to the left of any one element
+- selection_sort: n + n(n - 1)/2, it does not depend on the data at all
+
+The engine is selected per function with get_sort(), and cross_check() runs both engines
+on a copy of the same list so the formulas can be checked against the reference sorts.
+prefix_counter() keeps the same counts up to date while a list grows one element at a time.
+"""
+import bisect
+
+import counting_quad_sorts
+
+ENGINES = ('reference', 'analytic')  # the engines get_sort() knows about
+SORTS = ('bubble_sort', 'insertion_sort', 'opt_bubble_sort', 'selection_sort')  # the sorts both engines have
+
+
+def left_greater_counts(items):
+    """
+    Counts, for every element, how many elements to its left are strictly greater.
+    Uses a Fenwick tree over the ranks of the elements, so it runs in O(n log n).
+
+    Parameters:
+        items - a sequence of elements of comparable types.
+
+    Returns:
+        counts - a list where counts[i] is the number of j < i with items[j] > items[i]
+    """
+    ranks = sorted(set(items))  # coordinate compression of the values
+    tree = [0] * (len(ranks) + 1)  # Fenwick tree, index 0 is unused
+    counts = []
+
+    for i in range(len(items)):
+        rank = bisect.bisect_right(ranks, items[i])  # 1-based rank of items[i]
+
+        not_greater = 0  # number of elements seen so far that are <= items[i]
+        j = rank
+        while j > 0:
+            not_greater += tree[j]
+            j -= j & -j
+        counts.append(i - not_greater)
+
+        j = rank  # record items[i] in the tree
+        while j < len(tree):
+            tree[j] += 1
+            j += j & -j
+
+    return counts
+
+
+def bubble_count(n, max_displacement):
+    """
+    The count bubble_sort returns for a list of length n whose largest left displacement
+    is max_displacement.
+    """
+    passes = max_displacement + 1  # every pass moves each displaced element one step left
+    return passes * max(n, 1)  # each pass counts itself plus n - 1 inner iterations
+
+
+def insertion_count(n, inversions):
+    """The count insertion_sort returns for a list of length n with the given inversions."""
+    return max(n - 1, 0) + inversions  # one per outer iteration, one per swap
+
+
+def opt_bubble_count(n, max_displacement):
+    """
+    The count opt_bubble_sort returns for a list of length n whose largest left
+    displacement is max_displacement.
+    """
+    if n == 0:
+        return 1  # a single pass over an empty range
+    passes = max_displacement + 1
+    # pass k counts itself plus n - 1 - k inner iterations
+    return passes + passes * (n - 1) - passes * (passes - 1) // 2
+
+
+def selection_count(n):
+    """The count selection_sort returns for a list of length n."""
+    return n + n * (n - 1) // 2  # n outer iterations and n - 1 - i inner ones for each i
+
+
+def _sort_in_place(items):
+    """Sorts items, a list or other mutable sequence such as a memoryview, in place."""
+    if isinstance(items, list):
+        items.sort()
+    else:  # a memoryview has no sort(), and its slices only take bytes like objects
+        values = sorted(items)
+        for i in range(len(values)):
+            items[i] = values[i]
+
+
+def bubble_sort(items):
+    """
+    Analytic version of counting_quad_sorts.bubble_sort.
+
+    Parameters:
+        items - a list, or other mutable sequence such as a memoryview, of elements of comparable types.
+
+    Returns:
+        count - an integer sum of all the passes bubble sort makes through both outer/inner loops
+    """
+    counts = left_greater_counts(items)
+    _sort_in_place(items)  # keep the "sorts in place" side of the contract
+    return bubble_count(len(items), max(counts, default=0))
+
+
+def insertion_sort(items):
+    """
+    Analytic version of counting_quad_sorts.insertion_sort.
+
+    Parameters:
+        items - a list, or other mutable sequence such as a memoryview, of elements of comparable types.
+
+    Returns:
+        count - an integer sum of all the passes insertion sort makes through both outer/inner loops
+    """
+    inversions = sum(left_greater_counts(items))
+    _sort_in_place(items)
+    return insertion_count(len(items), inversions)
+
+
+def opt_bubble_sort(items):
+    """
+    Analytic version of counting_quad_sorts.opt_bubble_sort.
+
+    Parameters:
+        items - a list, or other mutable sequence such as a memoryview, of elements of comparable types.
+
+    Returns:
+        count - an integer sum of all the passes optimized bubble sort makes through both outer/inner loops
+    """
+    counts = left_greater_counts(items)
+    _sort_in_place(items)
+    return opt_bubble_count(len(items), max(counts, default=0))
+
+
+def selection_sort(items):
+    """
+    Analytic version of counting_quad_sorts.selection_sort.
+
+    Parameters:
+        items - a list, or other mutable sequence such as a memoryview, of elements of comparable types.
+
+    Returns:
+        count - an integer sum of all the passes selection sort makes through both outer/inner loops
+    """
+    _sort_in_place(items)
+    return selection_count(len(items))
+
+
+def prefix_counter(fn):
+    """
+    Returns a resumable counter for growing prefixes of one list. After the first n elements
+    of a list have been pushed, count() is what fn would return for that n element prefix.
+    Pushing element n only costs a binary search and an insertion, so a sweep over every
+    prefix of a list does not re-sort each prefix from scratch.
+
+    Parameters:
+        fn - one of the four counting sorts, from either engine (it is matched by name)
+
+    Returns:
+        A dict of two functions:
+            'push' - push(x) appends x to the prefix
+            'count' - count() returns the count for the current prefix
+    """
+    if fn.__name__ == 'bubble_sort':
+        count_of = lambda n, inversions, max_displacement: bubble_count(n, max_displacement)
+    elif fn.__name__ == 'insertion_sort':
+        count_of = lambda n, inversions, max_displacement: insertion_count(n, inversions)
+    elif fn.__name__ == 'opt_bubble_sort':
+        count_of = lambda n, inversions, max_displacement: opt_bubble_count(n, max_displacement)
+    elif fn.__name__ == 'selection_sort':
+        count_of = lambda n, inversions, max_displacement: selection_count(n)
+    else:
+        raise ValueError('No prefix counter for ' + fn.__name__)
+
+    prefix = []  # the elements pushed so far, kept in sorted order
+    state = [0, 0]  # [inversions, largest left displacement]
+
+    def push(x):
+        """Appends x to the prefix."""
+        greater = len(prefix) - bisect.bisect_right(prefix, x)  # elements to the left that are > x
+        bisect.insort_right(prefix, x)
+        state[0] += greater
+        if greater > state[1]:
+            state[1] = greater
+
+    def count():
+        """Returns the count for the current prefix."""
+        return count_of(len(prefix), state[0], state[1])
+
+    return {
+        'push': push,
+        'count': count
+    }
+
+
+def get_sort(name, engine='reference'):
+    """
+    Returns the counting sort called name from the chosen engine.
+
+    Parameters:
+        name - the name of the sort, e.g. 'bubble_sort'
+        engine - 'reference' for counting_quad_sorts or 'analytic' for this module
+
+    Returns:
+        fn - the counting sort function
+    """
+    if engine == 'reference':
+        return getattr(counting_quad_sorts, name)
+    if engine == 'analytic':
+        return globals()[name]
+    raise ValueError('Unknown engine: ' + str(engine))
+
+
+def cross_check(name, items):
+    """
+    Runs both engines of the sort called name on copies of items.
+
+    Parameters:
+        name - the name of the sort, e.g. 'insertion_sort'
+        items - a list of elements of comparable types, it is not modified
+
+    Returns:
+        (reference, analytic) - the counts from both engines, these should be equal
+    """
+    return get_sort(name, 'reference')(list(items)), get_sort(name, 'analytic')(list(items))
+
+
+if __name__ == '__main__':
+    # Unit testing, every analytic count must match the reference count
+    import random
+
+    print("Unit testing analytic_quad_sorts")
+
+    names = ['bubble_sort', 'insertion_sort', 'opt_bubble_sort', 'selection_sort']
+    for n in range(30):
+        for trial in range(20):
+            # a few duplicate values so that ties get checked as well
+            ran_list = [random.randrange(n + 1) for x in range(n)]
+            for name in names:
+                reference, analytic = cross_check(name, ran_list)
+                assert reference == analytic, (name, ran_list, reference, analytic)
+    print("All analytic counts match the reference sorts")
+
+    ran_list = [random.randrange(20) for x in range(40)]
+    for name in names:
+        counter = prefix_counter(get_sort(name))
+        for n in range(len(ran_list) + 1):
+            assert counter['count']() == get_sort(name)(ran_list[:n]), (name, n)
+            if n < len(ran_list):
+                counter['push'](ran_list[n])
+    print("All prefix counts match the reference sorts")
+
+    ran_list = [6, 1, 5, 4]
+    print("\nran_list: " + str(ran_list))
+    for name in names:
+        print("Counting total passes for " + name + ": " + str(cross_check(name, ran_list)))
+
+    import time
+    ran_list = [random.random() for x in range(10 ** 5)]
+    start = time.perf_counter()
+    count = insertion_sort(ran_list)
+    print("\nAnalytic insertion sort of 10^5 floats: " + str(count) + " in " +
+          str(round(time.perf_counter() - start, 3)) + "s")
@@ -0,0 +1,164 @@
+"""
+Non-interactive entry point for generating test data, for use from cron or a CI job where
+there is no terminal for the menus of a4. Every requested sort, measure and input
+distribution is one job, all the jobs run their trials in one shared pool of worker
+processes, and the exit status says whether they all succeeded.
+
+    python batch.py --sorts bubble_sort insertion_sort --max-n 100 --num-tests 1000 \
+        --out-dir results --workers 8 --seed 2019
+
+If a run is interrupted, the same command with --resume carries every unfinished job on
+from its last checkpoint, and jobs that finished are run again.
+
+Timing jobs (--measure time) run their trials one at a time in this process, so that other
+trials running alongside do not slow them down.
+
+Exit status: 0 when every job wrote its file, 1 when any job failed, 2 for bad arguments.
+"""
+import argparse
+import concurrent.futures
+import contextlib
+import os
+import sys
+
+import analytic_quad_sorts
+import collect_function_performance_data
+import input_distributions
+import profiling
+import sort_registry
+
+# Constants
+DEFAULT_MAX_N = 100  # Maximum length of randomly generated lists, as in a4
+DEFAULT_NUM_TESTS = 100  # Number of tests to run on each sort, as in a4
+
+
+def parse_args(argv=None):
+    """Returns the parsed command line arguments, argv defaults to sys.argv[1:]."""
+    parser = argparse.ArgumentParser(description='Generate sort test data without a terminal.')
+    parser.add_argument('--sorts', nargs='+', choices=sort_registry.names(), default=None,
+                        help='the registered sorts to run, default all of them (the four quadratic '
+                             'sorts with --engine analytic)')
+    parser.add_argument('--engine', choices=analytic_quad_sorts.ENGINES, default='reference',
+                        help='reference runs the registered sorts, analytic swaps in the analytic '
+                             'counts of the four quadratic sorts, default reference')
+    parser.add_argument('--max-n', type=int, default=DEFAULT_MAX_N,
+                        help='maximum length of the random lists, default ' + str(DEFAULT_MAX_N))
+    parser.add_argument('--num-tests', type=int, default=DEFAULT_NUM_TESTS,
+                        help='number of tests of each sort, default ' + str(DEFAULT_NUM_TESTS))
+    parser.add_argument('--schedule', choices=collect_function_performance_data.SCHEDULES, default='every',
+                        help='the sizes n tested up to max-n, default every n')
+    parser.add_argument('--factor', type=float, default=collect_function_performance_data.DEFAULT_GEOMETRIC_FACTOR,
+                        help='growth of n in the geometric schedule')
+    parser.add_argument('--sizes', nargs='+', type=int, default=None,
+                        help='an explicit list of sizes, in place of --schedule')
+    parser.add_argument('--measure', nargs='+', choices=['count', 'time'], default=['count'],
+                        help='what to record, each measure is a separate job, default count')
+    parser.add_argument('--distribution', nargs='+', choices=list(input_distributions.DISTRIBUTIONS),
+                        default=['uniform'], help='input distributions, each is a separate job, default uniform')
+    parser.add_argument('--format', choices=['csv', 'binary'], default='csv', dest='out_format',
+                        help='output file format, default csv')
+    parser.add_argument('--warmup', type=int, default=0,
+                        help='with --measure time, untimed calls made before each n is timed')
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='with --measure time, timed calls of each n, the fastest is kept')
+    parser.add_argument('--disable-gc', action='store_true',
+                        help='with --measure time, switch the garbage collector off during each timed call')
+    parser.add_argument('--out-dir', default='.', help='directory the files are written to')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help='number of worker processes, default one per CPU')
+    parser.add_argument('--profile', metavar='REPORT', default=None,
+                        help='profile the jobs and write the report to REPORT, the jobs run in this '
+                             'process and --workers is ignored')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='master seed, the same seed writes the same count files')
+    parser.add_argument('--target-width', type=float, default=None,
+                        help='adapt the trials to each n: --num-tests becomes the most any n gets, and an n '
+                             'stops once the 95%% confidence interval of its mean is narrower than this '
+                             'fraction of the mean, csv only')
+    parser.add_argument('--min-tests', type=int, default=collect_function_performance_data.DEFAULT_MIN_TESTS,
+                        help='with --target-width, the fewest trials any n gets, default '
+                             + str(collect_function_performance_data.DEFAULT_MIN_TESTS))
+    parser.add_argument('--resume', action='store_true',
+                        help='carry on interrupted jobs from their last checkpoint instead of starting over')
+    args = parser.parse_args(argv)
+    if args.max_n < 1 or args.num_tests < 1 or args.workers < 1 or args.repeat < 1:
+        parser.error('--max-n, --num-tests, --workers and --repeat must be at least 1')
+    if args.warmup < 0:
+        parser.error('--warmup must be at least 0')
+    if args.sorts is None:
+        args.sorts = list(analytic_quad_sorts.SORTS) if args.engine == 'analytic' else sort_registry.names()
+    elif args.engine == 'analytic':
+        unsupported = [name for name in args.sorts if name not in analytic_quad_sorts.SORTS]
+        if unsupported:
+            parser.error('--engine analytic only has ' + ', '.join(analytic_quad_sorts.SORTS) +
+                         ', not ' + ', '.join(unsupported))
+    if args.target_width is not None and args.out_format != 'csv':
+        parser.error('--target-width needs --format csv')
+    return args
+
+
+def main(argv=None):
+    """
+    Runs every (sort, measure, distribution) job of the command line in one shared worker pool.
+
+    Parameters:
+        argv - the command line arguments, default sys.argv[1:]
+
+    Returns:
+        status - 0 if every job succeeded, 1 if any failed
+    """
+    args = parse_args(argv)
+    if args.sizes is not None:
+        sizes = args.sizes
+    else:
+        sizes = collect_function_performance_data.size_schedule(args.schedule, args.max_n, args.factor)
+    jobs = [(name, measure, distribution)
+            for name in args.sorts for measure in args.measure for distribution in args.distribution]
+
+    status = 0
+    if args.profile:  # the profilers only see this process, so no pool
+        executor = None
+        profile = profiling.profiled(args.profile)
+    else:
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=args.workers)
+        profile = contextlib.nullcontext()
+    try:
+        with profile:
+            for name, measure, distribution in jobs:
+                try:
+                    if args.engine == 'analytic':
+                        fn = analytic_quad_sorts.get_sort(name, args.engine)
+                    else:
+                        fn = sort_registry.get(name)
+                    # timed trials run one at a time, in this process, so they do not compete for the CPUs
+                    job_executor = executor if measure == 'count' else None
+                    out_name = collect_function_performance_data.output_filename(fn, args.out_format, measure,
+                                                                                 distribution)
+                    collect_function_performance_data.test_function(fn, args.max_n, args.num_tests,
+                                                                    seed=args.seed,
+                                                                    out_format=args.out_format,
+                                                                    measure=measure,
+                                                                    distribution=distribution,
+                                                                    sizes=sizes,
+                                                                    out_dir=args.out_dir,
+                                                                    warmup=args.warmup,
+                                                                    repeat=args.repeat,
+                                                                    disable_gc=args.disable_gc,
+                                                                    executor=job_executor,
+                                                                    resume=args.resume,
+                                                                    target_width=args.target_width,
+                                                                    min_tests=args.min_tests)
+                except Exception as error:  # one failed job should not stop the others
+                    print(name + ' (' + measure + ', ' + distribution + ') failed: ' + repr(error),
+                          file=sys.stderr)
+                    status = 1
+                else:
+                    print(os.path.join(args.out_dir, out_name) + ' generated')
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""
+Benchmark of the two input buffers of collect_function_performance_data.run_trial. The
+'list' buffer sorts a new list slice of the input for every n, the 'array' buffer refills
+one scratch array('d') by slice assignment and sorts a memoryview of it. For each it
+reports, measured with tracemalloc, the peak memory of one trial and the bytes allocated
+making the copies that are sorted, summed over every n, as well as the time of the trial.
+
+Run it with: python benchmark_input_buffer.py
+"""
+import array
+import random
+import time
+import tracemalloc
+
+from collect_function_performance_data import prefix_copy, run_trial
+from counting_quad_sorts import insertion_sort
+
+# Constants
+MAX_N = 400  # Length of the input of each trial
+SEED = 2019  # Seed of the trial, the same input for both buffers
+
+
+def copy_bytes(input_buffer):
+    """Returns the bytes allocated by the copies one trial sorts, summed over every n."""
+    rng = random.Random(SEED)
+    rand_list = [rng.random() for x in range(MAX_N)]
+    if input_buffer == 'array':
+        source = memoryview(array.array('d', rand_list))
+        scratch = memoryview(array.array('d', rand_list))
+    else:
+        source, scratch = rand_list, None
+
+    total = 0
+    tracemalloc.start()
+    for n in range(MAX_N):
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        items = prefix_copy(source, n, scratch)
+        total += tracemalloc.get_traced_memory()[1] - before
+        del items
+    tracemalloc.stop()
+    return total
+
+
+def trial_peak(input_buffer):
+    """Returns (peak bytes above the start, seconds) of one trial, the peak under tracemalloc."""
+    tracemalloc.start()
+    start_memory = tracemalloc.get_traced_memory()[0]
+    run_trial(insertion_sort, MAX_N, SEED, input_buffer=input_buffer)
+    peak = tracemalloc.get_traced_memory()[1] - start_memory
+    tracemalloc.stop()
+
+    start = time.perf_counter()  # timed apart, tracemalloc slows every allocation down
+    run_trial(insertion_sort, MAX_N, SEED, input_buffer=input_buffer)
+    return peak, time.perf_counter() - start
+
+
+def main():
+    """Prints the memory and time of a trial with each input buffer and checks their rows match."""
+    print("One insertion sort trial at max_n = " + str(MAX_N))
+    for input_buffer in ['list', 'array']:
+        peak, elapsed = trial_peak(input_buffer)
+        print(input_buffer + ": peak " + str(peak // 1024) + " KiB, copies allocated " +
+              str(copy_bytes(input_buffer) // 1024) + " KiB in all, " + str(round(elapsed, 2)) + "s")
+    print("Same row from both: " + str(run_trial(insertion_sort, MAX_N, SEED) ==
+                                       run_trial(insertion_sort, MAX_N, SEED, input_buffer='array')))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark of drawing a series of points with plotter. It compares the old way, one
+plot_point (one oval item) per point, against plot_points drawing the whole series as one
+polyline or as one image, and reports the number of canvas items and the draw time,
+including the time Tk takes to render them, at 10^4 and 10^6 points.
+
+It needs a display. Run it with: python benchmark_plotter.py
+Or, without one, on headless_plotter's in-memory canvas, where rendering is making a PPM
+raster of the drawing: python benchmark_plotter.py --headless
+"""
+import argparse
+import math
+import time
+
+import headless_plotter
+import plotter
+
+# Constants
+SIZES = [10 ** 4, 10 ** 6]  # Numbers of points drawn
+
+
+def series(size):
+    """Returns size points of a sine wave spread across the default canvas."""
+    return [(i * 15 / size - 7.5, math.sin(i * 15 / size)) for i in range(size)]
+
+
+def draw_loop(plot, points):
+    """The old way, one plot_point per point."""
+    for x, y in points:
+        plot['plot_point'](x, y)
+
+
+def draw_line(plot, points):
+    """plot_points as one polyline."""
+    plot['plot_points'](points, style='line')
+
+
+def draw_image(plot, points):
+    """plot_points rasterised into one image."""
+    plot['plot_points'](points, style='image')
+
+
+def time_draw(draw, points, backend=plotter):
+    """
+    Returns (number of canvas items, seconds) for drawing points on a fresh plot of backend,
+    plotter or headless_plotter.
+    """
+    plot = backend.plot(title='Benchmark ' + draw.__name__)
+    start = time.perf_counter()
+    draw(plot, points)
+    if backend is headless_plotter:
+        plot['render']('ppm')  # rasterise what was drawn
+    else:
+        plot['update']()  # make Tk render what was drawn
+    elapsed = time.perf_counter() - start
+    items = plot['item_count']()
+    plot['destroy']()
+    return items, elapsed
+
+
+def main(argv=None):
+    """Prints the item count and draw time of each way of drawing, at each size."""
+    parser = argparse.ArgumentParser(description='Time drawing a series of points with plotter.')
+    parser.add_argument('--headless', action='store_true', help='draw on headless_plotter, no display needed')
+    backend = headless_plotter if parser.parse_args(argv).headless else plotter
+    for size in SIZES:
+        points = series(size)
+        print("\n" + str(size) + " points")
+        for draw in [draw_loop, draw_line, draw_image]:
+            items, elapsed = time_draw(draw, points, backend)
+            print(draw.__name__ + ": " + str(items) + " items, " + str(round(elapsed, 3)) + "s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""
+Micro-benchmark of the csv output stage of collect_function_performance_data.
+It compares the old writer, which called write once per cell and built every separator
+by string concatenation, against row_writer, which formats a whole row at once and
+writes buffered chunks.
+
+Run it with: python benchmark_row_writer.py
+"""
+import os
+import random
+import tempfile
+import time
+
+from collect_function_performance_data import row_writer
+
+# Constants
+MAX_N = 10000  # Number of columns in each row
+NUM_ROWS = 100  # Number of rows written by each writer
+REPEATS = 3  # The best of this many runs is reported
+
+
+def cell_writer(out_file, rows, max_n):
+    """The original output loop of test_function, one write per cell."""
+    for row in rows:
+        for n in range(max_n):
+            if (n + 1) == max_n:
+                out_file.write(str(row[n]))
+            else:
+                out_file.write(str(row[n]) + ",")
+        out_file.write("\n")
+
+
+def buffered_writer(out_file, rows, max_n):
+    """The row_writer output stage."""
+    writer = row_writer(out_file)
+    for row in rows:
+        writer['write_row'](row)
+    writer['flush']()
+
+
+def time_writer(write, rows, max_n, path):
+    """Returns the best time in seconds of REPEATS runs of write, and the file it wrote."""
+    best = None
+    for i in range(REPEATS):
+        out_file = open(path, 'w')
+        start = time.perf_counter()
+        write(out_file, rows, max_n)
+        out_file.close()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    file = open(path, 'r')
+    contents = file.read()
+    file.close()
+    return best, contents
+
+
+def main():
+    """Times both writers on the same rows and checks they write the same file."""
+    # counts of the same size as a bubble sort would give at these lengths
+    rows = [[random.randrange(n * n + 1) for n in range(MAX_N)] for i in range(NUM_ROWS)]
+    path = os.path.join(tempfile.mkdtemp(), 'benchmark.csv')
+
+    cell_time, cell_contents = time_writer(cell_writer, rows, MAX_N, path)
+    row_time, row_contents = time_writer(buffered_writer, rows, MAX_N, path)
+    os.remove(path)
+    os.rmdir(os.path.dirname(path))
+
+    print("Writing " + str(NUM_ROWS) + " rows at max_n = " + str(MAX_N))
+    print("Cell by cell writer: " + str(round(cell_time, 4)) + "s")
+    print("Buffered row writer: " + str(round(row_time, 4)) + "s")
+    print("Speed up: " + str(round(cell_time / row_time, 2)) + "x")
+    print("Same file written: " + str(cell_contents == row_contents))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,328 @@
+"""
+Benchmark suite of the hot paths of the program, with a stored baseline so that a slowdown
+fails the run instead of being noticed weeks later. It times:
+
+- each registered sort at a few sizes (sort/<name>/n=<n>),
+- test_function end to end (test_function/...),
+- get_file_column_averages on a large csv file and on the same file in the binary format
+  (column_averages/...),
+- plotter item creation, drawn on headless_plotter's in-memory canvas so no display is
+  needed (plotter/...).
+
+Each benchmark is timed in REPEAT samples. Benchmarks faster than MIN_SAMPLE_TIME are
+called several times in each sample, as timeit does, so that their times are not lost in
+the noise. Every sample is paired with a sample of a fixed calibration loop taken just
+before it, and what is compared is the median over the samples of the benchmark's time
+relative to the calibration's, so that a machine that is slower (or busier) as a whole,
+or for a moment, does not show up as a regression. The fastest time per call is reported
+too, in seconds, for reading, but it is not compared.
+
+The results are written to a JSON file and compared with the baseline, a JSON file of the
+same layout committed with the code. A benchmark whose relative time is more than the
+tolerance above its baseline's is a regression, and so is a benchmark that has no baseline
+to be checked against; the exit status is 1 if there are any.
+
+    python benchmark_suite.py                     compare with benchmark_baseline.json
+    python benchmark_suite.py --tolerance 0.5     allow 50% slower than the baseline
+    python benchmark_suite.py --update-baseline   record this machine's times as the baseline
+    python benchmark_suite.py --update-baseline --select sort/
+                                                  re-record only the sort benchmarks, keeping the rest
+
+The calibration only evens out the machine's speed as a whole, so the baseline is best
+recorded on the kind of machine the suite is run on.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+import collect_function_performance_data
+import file_column_averages
+import headless_plotter
+import result_file
+import sort_registry
+
+# Constants
+DEFAULT_BASELINE = 'benchmark_baseline.json'  # The committed baseline
+DEFAULT_RESULTS = 'benchmark_results.json'  # Where the results of a run are written
+DEFAULT_TOLERANCE = 0.3  # A benchmark may be this fraction slower than its baseline
+REPEAT = 5  # Samples of each benchmark, their median relative time is compared
+MIN_SAMPLE_TIME = 0.05  # Seconds, a fast benchmark is called as often as it takes to fill a sample
+QUAD_SIZES = [100, 400]  # Sizes the quadratic sorts are timed at
+NLOGN_SIZES = [1000, 10000]  # Sizes the other sorts are timed at
+QUAD_SORTS = ['bubble_sort', 'insertion_sort', 'opt_bubble_sort', 'selection_sort']
+AVERAGES_SHAPE = (200, 2000)  # Rows and columns of the file the column averages are timed on
+PLOT_POINTS = 10000  # Points drawn by the plotter benchmarks
+
+
+def sort_benchmarks():
+    """Returns a dict of name -> benchmark function, one for each registered sort and size."""
+    rng = random.Random(2019)
+    benchmarks = {}
+    for name in sort_registry.names():
+        for n in (QUAD_SIZES if name in QUAD_SORTS else NLOGN_SIZES):
+            items = [rng.random() for i in range(n)]
+            fn = sort_registry.get(name)
+            benchmarks['sort/' + name + '/n=' + str(n)] = lambda fn=fn, items=items: fn(list(items))
+    return benchmarks
+
+
+def harness_benchmarks(work_dir):
+    """Returns a dict of name -> benchmark function for test_function, writing into work_dir."""
+    def generate():
+        collect_function_performance_data.test_function('insertion_sort', 200, 10, seed=2019, out_dir=work_dir)
+
+    def generate_incremental():
+        collect_function_performance_data.test_function('insertion_sort', 200, 10, seed=2019, out_dir=work_dir,
+                                                        incremental=True)
+
+    return {'test_function/insertion_sort/max_n=200': generate,
+            'test_function/insertion_sort/max_n=200/incremental': generate_incremental}
+
+
+def averages_benchmarks(work_dir):
+    """Returns a dict of name -> benchmark function for the column averages of a large file."""
+    rows, columns = AVERAGES_SHAPE
+    rng = random.Random(2019)
+    csv_name = os.path.join(work_dir, 'large.csv')
+    binary_name = os.path.join(work_dir, 'large' + result_file.EXTENSION)
+
+    out_file = open(csv_name, 'w')
+    writer = collect_function_performance_data.row_writer(out_file)
+    binary_file = open(binary_name, 'wb')
+    binary_writer = result_file.binary_writer(binary_file, {'max_n': columns, 'num_tests': rows})
+    for i in range(rows):
+        row = [rng.randrange(n * n + 1) for n in range(columns)]
+        writer['write_row'](row)
+        binary_writer['write_row'](row)
+    writer['close']()
+    binary_writer['close']()
+
+    size = str(rows) + 'x' + str(columns)
+    return {'column_averages/csv/' + size: lambda: file_column_averages.get_file_column_averages(csv_name),
+            'column_averages/binary/' + size: lambda: file_column_averages.get_file_column_averages(binary_name)}
+
+
+def plotter_benchmarks():
+    """Returns a dict of name -> benchmark function for drawing points with plotter."""
+    points = [(i * 15 / PLOT_POINTS - 7.5, math.sin(i * 15 / PLOT_POINTS)) for i in range(PLOT_POINTS)]
+
+    def plot_point():
+        plot = headless_plotter.plot()
+        for x, y in points:
+            plot['plot_point'](x, y)
+
+    def plot_points():
+        headless_plotter.plot()['plot_points'](points, style='line')
+
+    def plot_function():
+        headless_plotter.plot()['plot_function'](math.sin)
+
+    return {'plotter/plot_point/' + str(PLOT_POINTS): plot_point,
+            'plotter/plot_points/' + str(PLOT_POINTS): plot_points,
+            'plotter/plot_function/sin': plot_function}
+
+
+def calibration():
+    """A fixed amount of plain Python work that every time is measured against."""
+    total = 0
+    items = list(range(1000))
+    for i in range(200):
+        for x in items:
+            if x < i:
+                total += x
+    return total
+
+
+def _sample(benchmark, calls):
+    """Returns the time in seconds of one call of benchmark, averaged over calls calls."""
+    start = time.perf_counter()
+    for i in range(calls):
+        benchmark()
+    return (time.perf_counter() - start) / calls
+
+
+def _calls_per_sample(benchmark):
+    """Returns the number of calls of benchmark that last MIN_SAMPLE_TIME, doubling like timeit's autorange."""
+    calls = 1
+    while _sample(benchmark, calls) * calls < MIN_SAMPLE_TIME:
+        calls *= 2
+    return calls
+
+
+def time_benchmark(benchmark, repeat=REPEAT):
+    """
+    Times benchmark in repeat samples, each making as many calls as it takes to last
+    MIN_SAMPLE_TIME, each just after a sample of calibration().
+
+    Returns:
+        (seconds, relative) - the fastest time of one call, and the median over the samples
+            of the time of one call divided by the time of one calibration() call
+    """
+    calls = _calls_per_sample(benchmark)
+    calibration_calls = _calls_per_sample(calibration)
+    times = []
+    ratios = []
+    for i in range(repeat):
+        calibration_time = _sample(calibration, calibration_calls)
+        times.append(_sample(benchmark, calls))
+        ratios.append(times[-1] / calibration_time)
+    return min(times), statistics.median(ratios)
+
+
+def run_suite(selected=None, repeat=REPEAT):
+    """
+    Runs the benchmarks.
+
+    Parameters:
+        selected - a list of strings, only benchmarks whose names contain one of them are
+            run. None runs them all
+        repeat - the number of samples of each benchmark (see time_benchmark)
+
+    Returns:
+        results - a dict of 'machine', 'python', 'benchmarks', a dict of name -> seconds,
+            and 'relative', a dict of name -> time relative to calibration() (see time_benchmark)
+    """
+    work_dir = tempfile.mkdtemp()
+    try:
+        benchmarks = {}
+        benchmarks.update(sort_benchmarks())
+        benchmarks.update(harness_benchmarks(work_dir))
+        benchmarks.update(averages_benchmarks(work_dir))
+        benchmarks.update(plotter_benchmarks())
+
+        times = {}
+        relative = {}
+        for name in benchmarks:
+            if selected is None or any(part in name for part in selected):
+                times[name], relative[name] = time_benchmark(benchmarks[name], repeat)
+                print(format(name, '<52') + format(times[name] * 1000, '>12.3f') + ' ms' +
+                      format(relative[name], '>12.3f') + ' x calibration')
+    finally:
+        shutil.rmtree(work_dir)
+
+    return {'machine': platform.platform() + ' ' + platform.machine(),
+            'python': platform.python_version(),
+            'benchmarks': times,
+            'relative': relative}
+
+
+def compare(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    Compares results with a baseline.
+
+    Parameters:
+        results, baseline - dicts as returned by run_suite
+        tolerance - the fraction a benchmark may be slower than its baseline
+
+    Returns:
+        regressions - a list of (name, slowdown) of the benchmarks whose time relative to
+            the calibration is more than (1 + tolerance) times the baseline's, slowdown is
+            the ratio of the two. Benchmarks missing from either are left out, see unbaselined.
+    """
+    regressions = []
+    for name, relative in results['relative'].items():
+        base = baseline['relative'].get(name)
+        if base is not None and relative > base * (1 + tolerance):
+            regressions.append((name, relative / base))
+    return regressions
+
+
+def unbaselined(results, baseline):
+    """Returns the sorted names of the benchmarks in results that have no entry in baseline."""
+    return sorted(name for name in results['relative'] if name not in baseline['relative'])
+
+
+def merge_baseline(results, baseline=None):
+    """
+    Records results in a baseline, replacing the entries of the benchmarks that were run and
+    keeping the others, so that a run of only some of the benchmarks (--select) does not
+    drop the rest from the baseline.
+
+    Parameters:
+        results - a dict as returned by run_suite
+        baseline - the baseline dict to merge into, or None to start a new one
+
+    Returns:
+        merged - the new baseline dict, with the machine and python of results
+    """
+    merged = {'benchmarks': {}, 'relative': {}}
+    if baseline is not None:
+        merged['benchmarks'].update(baseline['benchmarks'])
+        merged['relative'].update(baseline['relative'])
+    merged['benchmarks'].update(results['benchmarks'])
+    merged['relative'].update(results['relative'])
+    merged['machine'] = results['machine']
+    merged['python'] = results['python']
+    return merged
+
+
+def load_results(filename):
+    """Returns the results or baseline dict stored in filename, or None if there is no such file."""
+    try:
+        file = open(filename, 'r')
+    except FileNotFoundError:
+        return None
+    results = json.load(file)
+    file.close()
+    return results
+
+
+def main(argv=None):
+    """Runs the suite, writes the results and checks them against the baseline. Returns the exit status."""
+    parser = argparse.ArgumentParser(description='Time the hot paths and check them against a baseline.')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='the baseline JSON file')
+    parser.add_argument('--output', default=DEFAULT_RESULTS, help='where the results JSON is written')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='the fraction a benchmark may be slower than the baseline, default '
+                             + str(DEFAULT_TOLERANCE))
+    parser.add_argument('--repeat', type=int, default=REPEAT,
+                        help='samples of each benchmark, the median of their times relative to the '
+                             'calibration is compared')
+    parser.add_argument('--select', nargs='+', default=None, metavar='TEXT',
+                        help='only run the benchmarks whose names contain TEXT')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='record the results in the baseline instead of comparing, replacing '
+                             'the benchmarks that were run and keeping the others')
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.select, args.repeat)
+    out_file = open(args.output, 'w')
+    json.dump(results, out_file, indent=1, sort_keys=True)
+    out_file.close()
+
+    baseline = load_results(args.baseline)
+    if args.update_baseline:
+        out_file = open(args.baseline, 'w')
+        json.dump(merge_baseline(results, baseline), out_file, indent=1, sort_keys=True)
+        out_file.close()
+        print('\n' + str(len(results['benchmarks'])) + ' benchmarks recorded in ' + args.baseline)
+        return 0
+
+    if baseline is None:
+        print('\nNo baseline at ' + args.baseline + ', run with --update-baseline to record one', file=sys.stderr)
+        return 1
+
+    regressions = compare(results, baseline, args.tolerance)
+    for name, slowdown in regressions:
+        print('REGRESSION ' + name + ': ' + format(slowdown, '.2f') + ' times as slow as the baseline',
+              file=sys.stderr)
+    missing = unbaselined(results, baseline)
+    for name in missing:
+        print('NO BASELINE ' + name + ', run with --update-baseline --select ' + name + ' to record it',
+              file=sys.stderr)
+    print('\n' + str(len(results['benchmarks'])) + ' benchmarks, ' + str(len(regressions)) +
+          ' slower than the baseline by more than ' + format(args.tolerance, '.0%') + ', ' +
+          str(len(missing)) + ' without a baseline')
+    return 1 if regressions or missing else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,66 +1,744 @@
-"""
-This Module is for essentially contains one function, test_function
-which writes out a test data as a csv file for a given sort.
-
-Author: Ronan Almeida
-Student Num: 20178025
-Date: 2019-15-11
-"""
-import random  # import random for generating random floating point nums
-
-
-def test_function(fn, max_n, num_tests):
-    """
-    This function  is for writing out test data as a csv file given the parameters,
-
-    Parameters:
-        fn -  a function passed a parameter in this case one of the sorting algorithms
-        max_n -  max length of the randomly generated lists
-        num_tests - the number of tests to run of each chosen list
-
-    Returns:
-        None - wirtes out test data as a csv file
-    """
-    # open file for writing
-    out_file = open('' + fn.__name__ + '.csv', 'w')  # fn.__name is the name of the sorting algorithm
-
-    for i in range(num_tests):  # iterate through num tests
-        rand_list = [random.random() for x in range(max_n)]
-        # rand_list is a randomly generated list which contains 100 random floats ranging from 0 to 0 in value
-
-        row = []  # a list of all the count passes, each index represents the number of tests for that count sum
-
-        for n in range(max_n):  # increment n to max_n
-            row.append(fn(rand_list[:n]))
-            # fn(rand_list[:n]) takes the random list, slices it to n elements and then puts it into fn which
-            # is the sorting  algorithm that returns the specified count for the n - list elements
-            # This is then appended to the row list
-
-            # To ensure it is still a csv file
-            if (n + 1) == max_n:  # if we have reached the last element of the list
-                out_file.write(str(row[n]))  # write out the num
-            else:
-                out_file.write(str(row[n]) + ",")  # write out the num with a comma
-
-        out_file.write("\n")  # write a new line
-    out_file.close()  # close the file
-
-
-if __name__ == '__main__':
-    # Unit testing for collect_function_performence_data
-
-    from counting_quad_sorts import bubble_sort  # import  bubble sort for testing purposes
-
-    print("Unit Testing test_function")
-
-    print("\nWriting out data for bubble sort: 7 randomly  lists and 4 number of tests on each \n")
-    test_function(bubble_sort, 7, 4) # creating bubble sort test data
-
-    # showing that the test data exists by file io
-    file = open(bubble_sort.__name__+".csv",'r')
-    print("Reading the bubble sort test data \n" + str(file.readlines())) # displaying it
-    file.close()
-
-    import os # importing os inorder to delete the csv file
-    os.remove(bubble_sort.__name__+'.csv') # deleting the csv file,
-    # incase it may interfer with plotting the actual bubble sort one
+"""
+This Module is for essentially contains one function, test_function
+which writes out a test data as a csv file for a given sort.
+
+Author: Ronan Almeida
+Student Num: 20178025
+Date: 2019-15-11
+"""
+import array
+import concurrent.futures
+import functools
+import gc
+import itertools
+import json
+import math
+import os
+import random  # import random for generating random floating point nums
+import statistics
+import sys
+import time
+
+import analytic_quad_sorts
+import input_distributions
+import profiling
+import result_file
+import sort_registry
+
+# Constants
+DEFAULT_BUFFER_SIZE = 1 << 16  # Characters of formatted rows held before they are written out
+DEFAULT_FLUSH_INTERVAL = 5.0  # Seconds between flushes of the output file
+DEFAULT_GEOMETRIC_FACTOR = 1.25  # Growth of n from one size to the next in a geometric schedule
+SCHEDULES = ('every', 'powers_of_two', 'geometric')  # The size schedules size_schedule() makes
+INPUT_BUFFERS = ('list', 'array')  # How run_trial holds the input and the copies it sorts
+DEFAULT_CHECKPOINT_INTERVAL = 60.0  # Seconds between checkpoints of a job in progress
+PARTIAL_SUFFIX = '.partial'  # Added to the name of the output file while its rows are written
+PROGRESS_SUFFIX = '.progress'  # Added to the name of the output file for the checkpoint record
+DEFAULT_MIN_TESTS = 10  # Trials every column of an adaptive run gets before it may stop
+STOP_CHECKS = 2  # Consecutive trials after which a column's interval must be narrow enough for it to stop
+DEFAULT_CONFIDENCE = 0.95  # Confidence level of the intervals an adaptive run stops on
+
+
+def row_writer(out_file, buffer_size=DEFAULT_BUFFER_SIZE, flush_interval=DEFAULT_FLUSH_INTERVAL):
+    """
+    Returns a writer that formats each row of counts as one csv line and hands whole
+    chunks of lines to out_file, instead of one write per cell.
+
+    Parameters:
+        out_file - a file opened for writing text
+        buffer_size - the number of characters held before they are written to out_file
+        flush_interval - the number of seconds after which out_file is flushed, so that
+            rows already written survive an interruption. None never flushes early.
+
+    Returns:
+        A dict of three functions:
+            'write_row' - write_row(row) writes a list of counts as one line
+            'flush' - writes out everything held and flushes out_file
+            'close' - flushes and closes out_file
+    """
+    pending = []  # formatted lines not yet written
+    state = [0, time.monotonic()]  # [characters pending, time of the last flush]
+
+    def flush():
+        """Writes out everything held and flushes out_file."""
+        out_file.write(''.join(pending))
+        pending.clear()
+        state[0] = 0
+        out_file.flush()
+        state[1] = time.monotonic()
+
+    def write_row(row):
+        """Writes a list of counts as one csv line."""
+        line = ','.join(map(str, row)) + '\n'
+        pending.append(line)
+        state[0] += len(line)
+        if state[0] >= buffer_size:
+            out_file.write(''.join(pending))
+            pending.clear()
+            state[0] = 0
+        if flush_interval is not None and time.monotonic() - state[1] >= flush_interval:
+            flush()
+
+    def close():
+        """Flushes and closes out_file."""
+        flush()
+        out_file.close()
+
+    return {
+        'write_row': write_row,
+        'flush': flush,
+        'close': close
+    }
+
+
+def trial_seeds(seed, num_tests):
+    """
+    Derives one seed per trial from a master seed, so a trial's random list depends only
+    on the master seed and the trial's index and not on which process runs it.
+
+    Parameters:
+        seed - the master seed
+        num_tests - the number of trials
+
+    Returns:
+        seeds - a list of num_tests integer seeds
+    """
+    master = random.Random(seed)
+    return [master.getrandbits(64) for i in range(num_tests)]
+
+
+def read_progress(progress_path):
+    """
+    Reads the checkpoint record test_function keeps beside a job in progress.
+
+    Parameters:
+        progress_path - the name of the record, the output file's name + PROGRESS_SUFFIX
+
+    Returns:
+        progress - a dict of 'job', the options that decide the file, 'seed', 'rows', the
+            number of trials whose rows are safely written, 'bytes', the length of the
+            .partial file holding them, and 'random_state', the state of the global
+            random module after them (for a run without a seed). None if there is no record.
+    """
+    try:
+        file = open(progress_path, 'r')
+    except FileNotFoundError:
+        return None
+    progress = json.load(file)
+    file.close()
+    return progress
+
+
+def write_progress(progress_path, progress):
+    """Writes the checkpoint record atomically, so a crash leaves either the old one or the new one."""
+    temp_path = progress_path + '.tmp'
+    file = open(temp_path, 'w')
+    json.dump(progress, file)
+    file.flush()
+    os.fsync(file.fileno())
+    file.close()
+    os.replace(temp_path, progress_path)
+
+
+def _checkpoint(writer, out_file, progress_path, progress):
+    """
+    Makes the rows written so far durable and records them in the checkpoint record. The
+    record is only written after the fsync, so it never counts rows that could be lost.
+    """
+    writer['flush']()
+    os.fsync(out_file.fileno())
+    progress['bytes'] = os.fstat(out_file.fileno()).st_size
+    write_progress(progress_path, progress)
+
+
+def t_quantile(p, df):
+    """
+    Returns the p quantile of Student's t distribution with df degrees of freedom, by the
+    Cornish-Fisher expansion about the normal quantile. It comes out below the exact value,
+    and closer the more degrees of freedom there are, but how close depends on p too: at
+    p = 0.975 (a 95% interval) it is within 1% from 2 degrees of freedom up, at p = 0.995
+    (99%) only from 3 up: with 2 it gives 9.514 for the exact 9.925.
+    """
+    z = statistics.NormalDist().inv_cdf(p)
+    return (z + (z ** 3 + z) / (4 * df)
+            + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * df ** 2)
+            + (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / (384 * df ** 3)
+            + (79 * z ** 9 + 776 * z ** 7 + 1482 * z ** 5 - 1920 * z ** 3 - 945 * z) / (92160 * df ** 4))
+
+
+def relative_interval_width(count, total, squares, confidence=DEFAULT_CONFIDENCE):
+    """
+    Returns the width of the confidence interval of the mean of a column, relative to the mean.
+
+    Parameters:
+        count - the number of values, at least 2
+        total - the sum of the values
+        squares - the sum of the squares of the values
+        confidence - the confidence level of the interval
+
+    Returns:
+        width - 2 * t * s / sqrt(count) / |mean|, 0.0 if the values are all equal and
+            infinity if they are not but their mean is 0
+    """
+    spread = count * squares - total * total  # count * (count - 1) * variance, exact for ints
+    if spread <= 0:
+        return 0.0
+    if total == 0:
+        return math.inf
+    deviation = math.sqrt(spread / (count * (count - 1)))
+    half_width = t_quantile((1 + confidence) / 2, count - 1) * deviation / math.sqrt(count)
+    return 2 * half_width / abs(total / count)
+
+
+def adaptive_rows(trial, seeds, positions, columns, min_tests, target_width, confidence=DEFAULT_CONFIDENCE):
+    """
+    Yields the rows of a sequential sampling run. Each trial only counts (or times) fn at the
+    n still being sampled, a column stops once it has min_tests values and the confidence
+    interval of its mean has been narrower than target_width times the mean after
+    STOP_CHECKS trials in a row, so a few close values by chance do not stop it, and the run
+    ends when every column has stopped or the seeds run out.
+
+    Parameters:
+        trial - run_trial with everything but the trial seed and sizes bound
+        seeds - the seed of each trial, None for the global random module
+        positions - the n of each column
+        columns - the sampling state, a dict of 'active', the indexes of the columns still
+            sampled, 'trials', 'sums' and 'squares', the number of values of each column,
+            their sum and the sum of their squares, and 'passes', the trials in a row after
+            which each column's interval was narrow enough. It is brought up to date before
+            each row is yielded, so a checkpoint can save it (see test_function).
+        min_tests - the trials every column gets before it may stop
+        target_width - the relative width of the confidence interval a column stops at
+        confidence - the confidence level of the interval
+
+    Returns:
+        a generator of rows of len(positions) cells, '' in the columns already stopped
+    """
+    trials, sums, squares, passes = columns['trials'], columns['sums'], columns['squares'], columns['passes']
+    for trial_seed in seeds:
+        if not columns['active']:
+            return
+        values = trial(trial_seed, sizes=[positions[i] for i in columns['active']])
+        row = [''] * len(positions)
+        for i, value in zip(columns['active'], values):
+            row[i] = value
+            trials[i] += 1
+            sums[i] += value
+            squares[i] += value * value
+            if trials[i] < min_tests:
+                passes[i] = 0
+            elif relative_interval_width(trials[i], sums[i], squares[i], confidence) <= target_width:
+                passes[i] += 1
+            else:
+                passes[i] = 0
+        columns['active'] = [i for i in columns['active'] if passes[i] < STOP_CHECKS]
+        yield row
+
+
+def size_schedule(schedule, max_n, factor=DEFAULT_GEOMETRIC_FACTOR):
+    """
+    Returns the sizes n a test is run at, so that large n can be reached without running
+    every n in between.
+
+    Parameters:
+        schedule - 'every' for every n in range(max_n), which is what test_function does
+            without a schedule, 'powers_of_two' for 1, 2, 4, ... up to max_n, or
+            'geometric' for 1 and then each size about factor times the last, up to max_n
+        max_n - the largest size
+        factor - the growth of a geometric schedule, more than 1
+
+    Returns:
+        sizes - an ascending list of ints
+    """
+    if schedule == 'every':
+        return list(range(max_n))
+    if schedule == 'powers_of_two':
+        return [1 << k for k in range(max_n.bit_length())]
+    if schedule == 'geometric':
+        if factor <= 1:
+            raise ValueError('factor must be more than 1')
+        sizes = []
+        n = 1
+        while n < max_n:
+            sizes.append(n)
+            n = max(n + 1, round(n * factor))
+        if max_n > 0:
+            sizes.append(max_n)
+        return sizes
+    raise ValueError('Unknown schedule: ' + str(schedule))
+
+
+def run_trial(fn, max_n, trial_seed=None, incremental=False, measure='count', warmup=0, repeat=1,
+              disable_gc=False, distribution='uniform', distribution_options=None, sizes=None,
+              input_buffer='list'):
+    """
+    Runs one trial: builds a random list of max_n floats and counts (or times) fn on each of its prefixes.
+    For the distributions that are not input_distributions.PREFIX_CLOSED, a prefix does not
+    have the shape of the distribution, so a new list of n floats is built for each n instead,
+    with input_distributions.bulk when NumPy is installed and n is at least BULK_MIN_N.
+
+    Parameters:
+        fn - one of the sorting algorithms, it must be a module level function when run in
+            a worker process
+        max_n - length of the randomly generated list
+        trial_seed - the seed for this trial's random list, None uses the global random module
+        incremental - if True, the prefixes are swept with analytic_quad_sorts.prefix_counter,
+            only for the PREFIX_CLOSED distributions
+        measure - 'count' records what fn returns, 'time' records how long fn takes in
+            nanoseconds (time.perf_counter_ns)
+        warmup - when timing, the number of untimed calls of fn made before each prefix is timed
+        repeat - when timing, each prefix is timed this many times and the fastest time is kept
+        disable_gc - when timing, if True the garbage collector is switched off while fn runs
+        distribution - the name of the input_distributions the list is drawn from
+        distribution_options - a dict of options of the distribution, e.g. {'k': 5}
+        sizes - the ascending prefix lengths, none above max_n, to count (or time) fn on.
+            None is every n in range(max_n)
+        input_buffer - 'list' sorts a new list slice of the input for each n. 'array' keeps
+            the input in an array('d') and sorts the first n slots of one reusable scratch
+            array, refilled by a single slice copy, through a memoryview (see prefix_copy).
+            fn must then work on any mutable sequence, as the counting_quad_sorts do. Every
+            element read from the array makes a new float, so the sorts themselves run
+            slower: it trades time for memory (see benchmark_input_buffer).
+
+    Returns:
+        row - a list of max_n counts (or times), row[n] is the one for the first n elements.
+            With sizes, one count per size instead.
+    """
+    rng = random if trial_seed is None else random.Random(trial_seed)
+    options = distribution_options or {}
+    prefixes = distribution in input_distributions.PREFIX_CLOSED  # one list, cut to each n
+    scratch = memoryview(array.array('d', [0.0]) * max_n) if input_buffer == 'array' else None  # refilled before each sort
+
+    if prefixes:
+        rand_list = list(input_distributions.generate(distribution, rng, max_n, **options))
+        # rand_list is a generated list which contains max_n floats ranging from 0 to 1 in value,
+        # for the uniform distribution the same random floats as [rng.random() for x in range(max_n)]
+        source = rand_list if scratch is None else memoryview(array.array('d', rand_list))
+
+    if incremental:
+        counter = analytic_quad_sorts.prefix_counter(fn)
+        pushed = 0  # the length of the prefix pushed so far
+
+    row = []  # a list of all the count passes, each index represents the number of tests for that count sum
+
+    for n in (range(max_n) if sizes is None else sizes):  # increment n to max_n
+        if not prefixes and input_distributions.numpy is not None and n >= input_distributions.BULK_MIN_N:
+            values = input_distributions.bulk(distribution, rng, n, **options)  # the same floats, made by NumPy
+            source = values.tolist() if scratch is None else memoryview(array.array('d', values.tobytes()))
+        elif not prefixes:  # a list of n floats of the distribution's own shape
+            rand_list = list(input_distributions.generate(distribution, rng, n, **options))
+            source = rand_list if scratch is None else memoryview(array.array('d', rand_list))
+        if incremental:
+            while pushed < n:  # grow the prefix to n elements
+                counter['push'](rand_list[pushed])
+                pushed += 1
+            row.append(counter['count']())  # count for rand_list[:n]
+        elif measure == 'time':
+            row.append(time_call(fn, source, n, warmup, repeat, disable_gc, scratch))
+        else:
+            row.append(fn(prefix_copy(source, n, scratch)))
+        # fn(prefix_copy(source, n, scratch)) copies the input, cut to n elements, and then puts it into fn which
+        # is the sorting  algorithm that returns the specified count for the n - list elements
+        # This is then appended to the row list
+
+    return row
+
+
+def prefix_copy(source, n, scratch=None):
+    """
+    Returns a fresh copy of the first n elements of source for a sort to work on.
+
+    Parameters:
+        source - the input, a list or a memoryview of an array
+        n - the length of the prefix
+        scratch - None to copy into a new list slice, or a memoryview at least n long whose
+            first n slots are refilled from source with one slice assignment (a memcpy)
+            and returned, so no new list or float objects are made
+
+    Returns:
+        items - source[:n] as a new list, or as a view of the start of scratch
+    """
+    if scratch is None:
+        return source[:n]
+    items = scratch[:n]
+    items[:] = source[:n]
+    return items
+
+
+def time_call(fn, rand_list, n, warmup=0, repeat=1, disable_gc=False, scratch=None):
+    """
+    Times fn on a fresh copy of the first n elements of rand_list. Only the call to fn is
+    timed, the copy is made before the clock starts.
+
+    Parameters:
+        fn - one of the sorting algorithms
+        rand_list - the list (or memoryview, with scratch) whose prefix is sorted
+        n - the length of the prefix
+        warmup - the number of untimed calls made first
+        repeat - the number of timed calls, the fastest is returned
+        disable_gc - if True the garbage collector is switched off during each timed call
+        scratch - the reusable buffer the copies are made in, see prefix_copy
+
+    Returns:
+        elapsed - the fastest time of the timed calls in nanoseconds
+    """
+    for i in range(warmup):
+        fn(prefix_copy(rand_list, n, scratch))
+
+    best = None
+    gc_was_enabled = gc.isenabled()
+    for i in range(repeat):
+        items = prefix_copy(rand_list, n, scratch)
+        if disable_gc:
+            gc.disable()
+        try:
+            start = time.perf_counter_ns()
+            fn(items)
+            elapsed = time.perf_counter_ns() - start
+        finally:  # even if fn fails or the run is interrupted
+            if disable_gc and gc_was_enabled:
+                gc.enable()
+        if best is None or elapsed < best:
+            best = elapsed
+
+    return best
+
+
+def output_filename(fn, out_format='csv', measure='count', distribution='uniform'):
+    """
+    Returns the name of the file test_function writes for fn, e.g. bubble_sort.csv for
+    counts, bubble_sort_time.csv for times and bubble_sort_reversed.csv for counts on
+    reversed inputs. The uniform distribution is left out of the name.
+    """
+    name = fn.__name__
+    if distribution != 'uniform':
+        name += '_' + distribution
+    if measure != 'count':
+        name += '_' + measure
+    return name + ('.csv' if out_format == 'csv' else result_file.EXTENSION)
+
+
+def test_function(fn, max_n, num_tests, incremental=False, seed=None, workers=None,
+                  buffer_size=DEFAULT_BUFFER_SIZE, flush_interval=DEFAULT_FLUSH_INTERVAL, out_format='csv',
+                  measure='count', warmup=0, repeat=1, disable_gc=False, out_dir='.', executor=None,
+                  distribution='uniform', distribution_options=None, sizes=None, input_buffer='list',
+                  resume=False, checkpoint_interval=DEFAULT_CHECKPOINT_INTERVAL, target_width=None,
+                  min_tests=DEFAULT_MIN_TESTS, confidence=DEFAULT_CONFIDENCE):
+    """
+    This function  is for writing out test data as a csv file given the parameters,
+
+    Parameters:
+        fn -  a function passed a parameter in this case one of the sorting algorithms, or
+            the name it is registered under in sort_registry
+        max_n -  max length of the randomly generated lists
+        num_tests - the number of tests to run of each chosen list
+        incremental - if True, each row is swept with analytic_quad_sorts.prefix_counter
+            so the count for prefix n + 1 is built from the count for prefix n instead
+            of sorting every prefix from scratch. The file written is the same.
+        seed - if given, every trial gets its own seed derived from this master seed
+            (see trial_seeds) and the file only depends on seed. If None, the trials use
+            the global random module as they always have.
+        workers - if given, the trials are spread over a process pool of this many
+            workers. The rows are still written in trial order and, since parallel
+            trials need their own seeds, a master seed is drawn from the global random
+            module when seed is None.
+        buffer_size - characters of output held before they are written (see row_writer)
+        flush_interval - seconds between flushes of the output file (see row_writer)
+        out_format - 'csv' writes <fn>.csv, 'binary' writes <fn>.bin in the binary
+            result format of result_file, whose header records fn, max_n, num_tests and seed
+        measure - 'count' records the count fn returns. 'time' records the wall clock time
+            of each call in nanoseconds instead, in the same layout, to <fn>_time.csv
+        warmup - when timing, untimed calls made before each prefix is timed
+        repeat - when timing, the fastest of this many timed calls is recorded
+        disable_gc - when timing, if True the garbage collector is off during each timed call
+        out_dir - the directory the file is written to, made if it does not exist
+        executor - a concurrent.futures executor to run the trials in instead of a pool of
+            workers made for this call, so one pool can be shared by many calls. It is left
+            running. As with workers, a master seed is drawn when seed is None.
+        distribution - the name of the input_distributions the lists are drawn from, it is
+            added to the file name (unless it is 'uniform') and to the binary header
+        distribution_options - a dict of options of the distribution, e.g. {'k': 5} for
+            nearly_sorted. They are recorded in the binary header.
+        sizes - the size schedule, an ascending list of the n to test, none above max_n
+            (see size_schedule). None tests every n in range(max_n). The n of each column
+            is recorded, in a csv file on a first line starting with result_file.SIZES_COMMENT
+            and in a binary file as 'sizes' in the header.
+        input_buffer - 'list' or 'array', how each trial holds its input and the copies it
+            sorts (see run_trial). 'array' makes no new objects per n but needs a fn that
+            works on any mutable sequence. The file written is the same.
+        resume - if True and an interrupted run of the same job left a checkpoint, carry
+            on from the last row it recorded, with the seed (or the random state) it
+            recorded, so the finished file is the one an uninterrupted run would write.
+            A checkpoint of a job with other options is a ValueError. Without a
+            checkpoint, or if its .partial file is gone, the job starts from the beginning.
+        checkpoint_interval - the seconds between checkpoints. At each one the rows
+            written so far are fsynced and the trial index and seed (or random state) are
+            saved beside the output file in <file>.progress. None makes no checkpoints.
+        target_width - if given, the number of trials adapts to each n (see adaptive_rows):
+            every column gets at least min_tests trials and at most num_tests, and stops
+            once the confidence interval of its mean is narrower than target_width times
+            the mean, e.g. 0.05 for 5%. Columns that stopped are left empty in later rows,
+            and a last line starting with result_file.TRIALS_COMMENT records the number of
+            trials of each column. The trials run one at a time in this process, since each
+            decides what the next one tests. Only the csv format can hold the uneven columns.
+        min_tests - the fewest trials of any column of an adaptive run, at least 3, or 4 if
+            confidence is above 0.95, so that t_quantile is within 1% of the exact value
+        confidence - the confidence level of the intervals of an adaptive run
+
+    The rows are written to <file>.partial, which replaces the output file only once every
+    row is written, so an interrupted run never leaves a truncated output file behind and
+    an earlier file survives until the new one is whole.
+
+    Inside a profiling.profiled() block the calls of fn are recorded for the profiling
+    report, and the trials run in this process whatever workers or executor say.
+
+    Returns:
+        None - wirtes out test data as a csv file
+    """
+    if isinstance(fn, str):
+        fn = sort_registry.get(fn)
+    if incremental:
+        analytic_quad_sorts.prefix_counter(fn)  # fail before the file is opened if fn has none
+        if measure != 'count':
+            raise ValueError('The incremental sweep only records counts')
+        if distribution not in input_distributions.PREFIX_CLOSED:
+            raise ValueError('The incremental sweep needs a distribution whose prefixes keep its shape, one of '
+                             + ', '.join(input_distributions.PREFIX_CLOSED))
+    if out_format not in ('csv', 'binary'):
+        raise ValueError('Unknown out_format: ' + str(out_format))
+    if measure not in ('count', 'time'):
+        raise ValueError('Unknown measure: ' + str(measure))
+    if repeat < 1:
+        raise ValueError('repeat must be at least 1')
+    if distribution not in input_distributions.DISTRIBUTIONS:
+        raise ValueError('Unknown distribution: ' + str(distribution))
+    if input_buffer not in INPUT_BUFFERS:
+        raise ValueError('Unknown input_buffer: ' + str(input_buffer))
+    if sizes is not None:
+        sizes = [int(n) for n in sizes]
+        ascending = all(sizes[i] < sizes[i + 1] for i in range(len(sizes) - 1))
+        if not ascending or (sizes and (sizes[0] < 0 or sizes[-1] > max_n)):
+            raise ValueError('sizes must be ascending and between 0 and max_n')
+        if sizes == list(range(max_n)):  # the default schedule, written as always
+            sizes = None
+    if target_width is not None:
+        if out_format != 'csv':
+            raise ValueError('An adaptive run needs the csv format, the rows of a binary file are all full')
+        if target_width <= 0 or not 0 < confidence < 1:
+            raise ValueError('target_width must be above 0 and confidence between 0 and 1')
+        fewest = 3 if confidence <= 0.95 else 4  # see t_quantile
+        if not fewest <= min_tests <= num_tests:
+            raise ValueError('min_tests must be at least ' + str(fewest) + ' at confidence ' + str(confidence)
+                             + ' and at most num_tests')
+        workers = executor = None  # each trial depends on the ones before it
+
+    if out_dir:  # '' is the current directory
+        os.makedirs(out_dir, exist_ok=True)
+    out_path = os.path.join(out_dir, output_filename(fn, out_format, measure, distribution))
+    partial_path = out_path + PARTIAL_SUFFIX
+    progress_path = out_path + PROGRESS_SUFFIX
+    job = json.loads(json.dumps({'function': fn.__name__,  # as it reads back from the record
+                                 'max_n': max_n,
+                                 'num_tests': num_tests,
+                                 'incremental': incremental,
+                                 'out_format': out_format,
+                                 'measure': measure,
+                                 'distribution': distribution,
+                                 'distribution_options': distribution_options or {},
+                                 'sizes': sizes,
+                                 'input_buffer': input_buffer,
+                                 'target_width': target_width,
+                                 'min_tests': min_tests if target_width is not None else None,
+                                 'confidence': confidence if target_width is not None else None}))
+    progress = read_progress(progress_path) if resume else None
+    if progress is not None and not os.path.exists(partial_path):  # nothing left to resume
+        progress = None
+    if progress is None:
+        done = 0  # trials whose rows are written
+        if os.path.exists(progress_path):  # a record of an earlier run, not resumed
+            os.remove(progress_path)
+    else:
+        if progress['job'] != job or (seed is not None and seed != progress['seed']):
+            raise ValueError(progress_path + ' is the checkpoint of a different job')
+        seed = progress['seed']
+        done = progress['rows']
+        if seed is None:  # carry on drawing from the global random module where it stopped
+            state = progress['random_state']
+            random.setstate((state[0], tuple(state[1]), state[2]))
+            workers = executor = None
+
+    if (workers is not None or executor is not None) and seed is None:
+        seed = random.getrandbits(64)
+    if profiling.active():  # the profilers only see this process, the seed keeps the file the same
+        fn = profiling.wrap(fn)
+        workers = executor = None
+
+    trial = functools.partial(run_trial, fn, max_n,
+                              incremental=incremental,
+                              measure=measure,
+                              warmup=warmup,
+                              repeat=repeat,
+                              disable_gc=disable_gc,
+                              distribution=distribution,
+                              distribution_options=distribution_options,
+                              sizes=sizes,
+                              input_buffer=input_buffer)
+    own_executor = False  # True when the pool is made here and must be shut down here
+    if target_width is not None:
+        positions = sizes if sizes is not None else list(range(max_n))
+        if progress is not None:
+            columns = progress['columns']
+        else:
+            columns = {'active': list(range(len(positions))),
+                       'trials': [0] * len(positions),
+                       'sums': [0] * len(positions),
+                       'squares': [0] * len(positions),
+                       'passes': [0] * len(positions)}
+        seeds = itertools.repeat(None, num_tests - done) if seed is None else trial_seeds(seed, num_tests)[done:]
+        rows = adaptive_rows(trial, seeds, positions, columns, min_tests, target_width, confidence)
+    elif seed is None:
+        rows = (trial(None) for i in range(num_tests - done))
+    else:
+        seeds = trial_seeds(seed, num_tests)[done:]
+        if workers is None and executor is None:
+            rows = map(trial, seeds)
+        else:
+            if executor is None:
+                executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+                own_executor = True
+            pool_size = workers or os.cpu_count() or 1
+            # map hands the rows back in trial order, however the workers finish
+            rows = executor.map(trial, seeds, chunksize=max(1, num_tests // (pool_size * 4)))
+
+    # open the partial file, named after the sorting algorithm, for writing or to append to
+    if progress is not None:
+        os.truncate(partial_path, progress['bytes'])  # drop any rows written after the checkpoint
+    if out_format == 'csv':
+        out_file = open(partial_path, 'w' if progress is None else 'a')
+        if sizes is not None and progress is None:  # the n of each column
+            out_file.write(result_file.SIZES_COMMENT + ','.join(map(str, sizes)) + '\n')
+        writer = row_writer(out_file, buffer_size, flush_interval)
+    else:
+        out_file = open(partial_path, 'wb' if progress is None else 'ab', buffering=buffer_size)
+        metadata = {'function': fn.__name__,
+                    'max_n': max_n,
+                    'num_tests': num_tests,
+                    'seed': seed,
+                    'measure': measure,
+                    'distribution': distribution,
+                    'distribution_options': distribution_options or {}}
+        if sizes is not None:
+            metadata['sizes'] = sizes
+        writer = result_file.binary_writer(out_file, metadata, flush_interval, header=progress is None)
+
+    progress = {'job': job, 'seed': seed, 'rows': done}
+    if target_width is not None:  # the sampling state, kept up to date by adaptive_rows
+        progress['columns'] = columns
+    if seed is None:  # the state the next trial starts from, kept as each row is written
+        progress['random_state'] = random.getstate()
+    last_checkpoint = time.monotonic()
+    try:
+        for row in rows:  # iterate through num tests
+            writer['write_row'](row)  # each row becomes one line or one row of the matrix
+            progress['rows'] += 1
+            if seed is None:
+                progress['random_state'] = random.getstate()
+            if checkpoint_interval is not None and time.monotonic() - last_checkpoint >= checkpoint_interval:
+                _checkpoint(writer, out_file, progress_path, progress)
+                last_checkpoint = time.monotonic()
+    except BaseException:  # interrupted, keep the rows written so far for a resume
+        try:
+            if checkpoint_interval is not None:
+                _checkpoint(writer, out_file, progress_path, progress)
+            writer['close']()
+        except Exception as error:  # e.g. the disk that failed the write, the first error is the one raised
+            print('Could not checkpoint ' + partial_path + ': ' + repr(error), file=sys.stderr)
+        raise
+    finally:
+        if own_executor:
+            executor.shutdown(cancel_futures=True)
+
+    writer['flush']()
+    if target_width is not None:  # the trials each column got
+        out_file.write(result_file.TRIALS_COMMENT + ','.join(map(str, columns['trials'])) + '\n')
+        out_file.flush()
+    os.fsync(out_file.fileno())
+    writer['close']()  # close the file
+    os.replace(partial_path, out_path)  # the whole file appears at once
+    if os.path.exists(progress_path):
+        os.remove(progress_path)
+
+
+if __name__ == '__main__':
+    # Unit testing for collect_function_performence_data
+
+    from counting_quad_sorts import bubble_sort  # import  bubble sort for testing purposes
+
+    print("Unit Testing test_function")
+
+    print("\nWriting out data for bubble sort: 7 randomly  lists and 4 number of tests on each \n")
+    test_function(bubble_sort, 7, 4) # creating bubble sort test data
+
+    # showing that the test data exists by file io
+    file = open(bubble_sort.__name__+".csv",'r')
+    print("Reading the bubble sort test data \n" + str(file.readlines())) # displaying it
+    file.close()
+
+    # the incremental sweep must write exactly the same file for the same seed
+    random.seed(2019)
+    test_function(bubble_sort, 30, 4)
+    file = open(bubble_sort.__name__ + ".csv", 'r')
+    full_sweep = file.read()
+    file.close()
+    random.seed(2019)
+    test_function(bubble_sort, 30, 4, incremental=True)
+    file = open(bubble_sort.__name__ + ".csv", 'r')
+    print("\nIncremental sweep matches the full sweep: " + str(file.read() == full_sweep))
+    file.close()
+
+    # a seeded run must write the same file whatever the number of workers
+    outputs = []
+    for workers in [None, 1, 3]:
+        test_function(bubble_sort, 30, 7, seed=2019, workers=workers)
+        file = open(bubble_sort.__name__ + ".csv", 'r')
+        outputs.append(file.read())
+        file.close()
+    print("Seeded runs match for 0, 1 and 3 workers: " + str(outputs[0] == outputs[1] == outputs[2]))
+
+    # an interrupted run must carry on from its checkpoint and write the same file
+    calls = [0]
+
+    def interrupted_sort(items):
+        calls[0] += 1
+        if calls[0] == 100:  # part way through the fourth trial
+            raise KeyboardInterrupt
+        return bubble_sort(items)
+    interrupted_sort.__name__ = bubble_sort.__name__
+
+    try:
+        test_function(interrupted_sort, 30, 7, seed=2019, checkpoint_interval=0)
+    except KeyboardInterrupt:
+        progress = read_progress(bubble_sort.__name__ + ".csv" + PROGRESS_SUFFIX)
+        print("Interrupted after " + str(progress['rows']) + " trials, the finished file is untouched: " +
+              str(open(bubble_sort.__name__ + ".csv", 'r').read() == outputs[0]))
+    test_function(interrupted_sort, 30, 7, seed=2019, resume=True)
+    file = open(bubble_sort.__name__ + ".csv", 'r')
+    print("Resumed run matches an uninterrupted one: " + str(file.read() == outputs[0]))
+    file.close()
+
+    # an adaptive run stops sampling each n once its average is known to within 10%
+    import file_column_averages
+    test_function(bubble_sort, 30, 200, seed=2019, target_width=0.1)
+    print("\nTrials per n of an adaptive run: " +
+          str(file_column_averages.get_file_column_trials(bubble_sort.__name__ + ".csv")))
+
+    import os # importing os inorder to delete the csv file
+    os.remove(bubble_sort.__name__+'.csv') # deleting the csv file,
+    # incase it may interfer with plotting the actual bubble sort one
+
+    # timing mode, min of 3 runs with the garbage collector off
+    test_function(bubble_sort, 30, 4, measure='time', warmup=1, repeat=3, disable_gc=True)
+    file = open(output_filename(bubble_sort, measure='time'), 'r')
+    print("\nBubble sort times in ns for the first trial \n" + file.readline())
+    file.close()
+    os.remove(output_filename(bubble_sort, measure='time'))
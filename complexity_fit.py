@@ -0,0 +1,181 @@
+"""
+This module checks the complexity class of a sort from its test data. It fits the column
+averages from file_column_averages against each candidate model T(n) = a * f(n) + b, with
+f(n) one of n, n log n, n^2 and n^3, by least squares, and reports the model with the best
+coefficient of determination (R^2) along with its coefficients.
+
+With NumPy installed every fit is one vectorized least squares solve, otherwise the two
+normal equations are solved directly.
+
+Run as a program it fits every result file in a directory, so a CI job can check the
+complexity classes of hundreds of runs:
+
+    python complexity_fit.py results/ --expect bubble_sort=n^2 --expect selection_sort=n^2
+
+An --expect NAME is the file name without its extension, bubble_sort for bubble_sort.csv,
+so it does not also check bubble_sort_reversed.csv. It exits with status 1 if any --expect
+does not match the best model, names no fitted file, or if the directory holds no file that
+could be fitted.
+"""
+import argparse
+import math
+import os
+import sys
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional, the fits are solved in plain Python without it
+    numpy = None
+
+import file_column_averages
+from files_and_directories import get_filenames
+
+# Constants
+MODELS = {  # name -> f(n), the candidate models T(n) = a * f(n) + b
+    'n': lambda n: n,
+    'n log n': lambda n: n * math.log2(n) if n > 0 else 0.0,
+    'n^2': lambda n: n * n,
+    'n^3': lambda n: n * n * n,
+}
+
+
+def fit_model(xs, ys, model):
+    """
+    Fits T(n) = a * f(n) + b to the points (xs, ys) by least squares.
+
+    Parameters:
+        xs - the values of n
+        ys - the measured T(n) for each n
+        model - the name of a model in MODELS
+
+    Returns:
+        a dict of 'model', 'a', 'b' and 'r2' (the coefficient of determination)
+    """
+    f = MODELS[model]
+    fx = [f(x) for x in xs]
+    count = len(ys)
+
+    if numpy is not None:
+        columns = numpy.column_stack([numpy.asarray(fx, dtype=float), numpy.ones(count)])
+        ys_array = numpy.asarray(ys, dtype=float)
+        (a, b), residuals, rank, singular = numpy.linalg.lstsq(columns, ys_array, rcond=None)
+        ss_res = float(numpy.sum((columns @ numpy.array([a, b]) - ys_array) ** 2))
+        ss_tot = float(numpy.sum((ys_array - ys_array.mean()) ** 2))
+        a, b = float(a), float(b)
+    else:
+        mean_f = sum(fx) / count
+        mean_y = sum(ys) / count
+        s_ff = sum((v - mean_f) ** 2 for v in fx)
+        s_fy = sum((fx[i] - mean_f) * (ys[i] - mean_y) for i in range(count))
+        a = s_fy / s_ff if s_ff else 0.0
+        b = mean_y - a * mean_f
+        ss_res = sum((a * fx[i] + b - ys[i]) ** 2 for i in range(count))
+        ss_tot = sum((y - mean_y) ** 2 for y in ys)
+
+    r2 = 1.0 - ss_res / ss_tot if ss_tot else 1.0
+    return {'model': model, 'a': a, 'b': b, 'r2': r2}
+
+
+def fit_complexity(ys, xs=None):
+    """
+    Fits every model in MODELS to the points (xs, ys).
+
+    Parameters:
+        ys - the measured T(n), e.g. the column averages of a result file
+        xs - the values of n, by default the column indexes 0, 1, 2, ...
+
+    Returns:
+        fits - a list of the dicts from fit_model, best (highest R^2) first
+    """
+    if xs is None:
+        xs = range(len(ys))
+    xs = list(xs)
+    if len(ys) < 3:
+        raise ValueError('At least 3 points are needed to fit a model')
+    fits = [fit_model(xs, ys, model) for model in MODELS]
+    fits.sort(key=lambda fit: fit['r2'], reverse=True)
+    return fits
+
+
+def fit_file(filename):
+    """
+    Returns the fits (see fit_complexity) of the column averages of a result file, at the n
+    recorded for each column (see file_column_averages.get_file_column_positions).
+    """
+    points = file_column_averages.get_file_column_averages(filename, positions=True)
+    return fit_complexity([y for x, y in points], [x for x, y in points])
+
+
+def fit_directory(directory='.', pattern='*.csv'):
+    """
+    Fits every result file in directory matching pattern.
+
+    Parameters:
+        directory - the directory of the result files
+        pattern - the filename filter (accepts wildcards)
+
+    Returns:
+        a dict of filename -> fits (see fit_complexity), files that cannot be fitted, e.g.
+        with fewer than three columns, are left out and reported on stderr
+    """
+    results = {}
+    cwd = os.getcwd()
+    try:
+        for filename in sorted(get_filenames(directory, pattern)):  # get_filenames changes directory
+            try:
+                results[filename] = fit_file(filename)
+            except ValueError as error:  # too few columns to fit, or not a result file
+                print('Skipped ' + filename + ': ' + str(error), file=sys.stderr)
+    finally:
+        os.chdir(cwd)
+    return results
+
+
+def parse_expectation(text):
+    """Parses a NAME=MODEL --expect argument into (name, model), for argparse."""
+    name, sep, model = text.partition('=')
+    if not sep or not name:
+        raise argparse.ArgumentTypeError('expected NAME=MODEL, got ' + repr(text))
+    if model not in MODELS:
+        raise argparse.ArgumentTypeError('unknown model ' + model + ', choose from ' + ', '.join(MODELS))
+    return name, model
+
+
+def main(argv=None):
+    """Fits a directory of result files and checks the --expect'ed models. Returns the exit status."""
+    parser = argparse.ArgumentParser(description='Fit complexity models to result files.')
+    parser.add_argument('directory', nargs='?', default='.', help='directory of the result files')
+    parser.add_argument('--pattern', default='*.csv', help='filename filter, default *.csv')
+    parser.add_argument('--expect', action='append', default=[], metavar='NAME=MODEL', type=parse_expectation,
+                        help='fail unless the file NAME (without extension) is best fitted by MODEL')
+    args = parser.parse_args(argv)
+    expected = dict(args.expect)
+
+    if not os.path.isdir(args.directory):
+        print('No directory ' + args.directory, file=sys.stderr)
+        return 1
+    results = fit_directory(args.directory, args.pattern)
+    if not results:
+        print('No result files to fit in ' + args.directory + ' matching ' + args.pattern, file=sys.stderr)
+        return 1
+
+    stems = {filename: os.path.splitext(filename)[0] for filename in results}
+    status = 0
+    for name in expected:
+        if name not in stems.values():
+            print('No fitted file named ' + name + ' to check against ' + expected[name], file=sys.stderr)
+            status = 1
+    for filename in results:
+        best = results[filename][0]
+        line = (filename + ': T(n) = ' + format(best['a'], '.4g') + ' * ' + best['model'] +
+                ' + ' + format(best['b'], '.4g') + ', R^2 = ' + format(best['r2'], '.6f'))
+        name = stems[filename]
+        if name in expected and best['model'] != expected[name]:
+            line += '  (expected ' + expected[name] + ')'
+            status = 1
+        print(line)
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,351 @@
+"""
+This module contains the O(n log n) sorting functions, the companions of counting_quad_sorts.
+Each one sorts items in place and returns the number of comparisons it made between
+elements, so test_function and the plotting code take them just like the quadratic sorts.
+
+The counts are worked out from how far the indexes moved wherever that is exact (a merge
+makes one comparison per element it outputs before one side runs out, a partition scan
+makes one more comparison than the steps it takes), instead of a count += 1 beside every
+comparison, so that counting costs little next to the sort itself at n = 10^6.
+
+Quick sort comes with four pivot strategies. The random one draws from its own
+random.Random, seeded the same on every call, so the count only depends on the list and
+the global random module that makes the test lists is left alone.
+
+Like the quadratic sorts they take any mutable sequence, so they can sort the memoryview
+scratch buffers of test_function's 'array' input_buffer. The merge sorts merge in lists
+and copy the result back.
+"""
+import random
+
+# Constants
+MIN_RUN = 32  # natural_merge_sort extends shorter runs to this length with insertion sort
+PIVOT_SEED = 20191115  # seed of the private random.Random of the random pivot strategy
+PIVOTS = ('first', 'middle', 'median_of_three', 'random')  # the pivot strategies of quick_sort
+
+
+def _write_back(items, values):
+    """Copies the list values into items, a mutable sequence of the same length."""
+    if isinstance(items, list):
+        items[:] = values
+    else:  # e.g. a memoryview, whose slices only take bytes like objects
+        for i in range(len(values)):
+            items[i] = values[i]
+
+
+def _merge(src, dst, lo, mid, hi):
+    """
+    Merges the sorted runs src[lo:mid] and src[mid:hi] into dst[lo:hi].
+
+    Returns:
+        count - the number of comparisons made
+    """
+    i, j, k = lo, mid, lo
+    while i < mid and j < hi:
+        if src[j] < src[i]:  # take from the right only when strictly smaller, so the merge is stable
+            dst[k] = src[j]
+            j += 1
+        else:
+            dst[k] = src[i]
+            i += 1
+        k += 1
+    count = (i - lo) + (j - mid)  # one comparison per element output so far
+
+    # copy whichever run is left over
+    if i < mid:
+        dst[k:hi] = src[i:mid]
+    else:
+        dst[k:hi] = src[j:hi]
+    return count
+
+
+def _merge_sort(src, dst, lo, hi):
+    """Sorts src[lo:hi] into dst[lo:hi], the two start out equal and swap roles each level down."""
+    if hi - lo < 2:
+        return 0
+    mid = (lo + hi) // 2
+    count = _merge_sort(dst, src, lo, mid)
+    count += _merge_sort(dst, src, mid, hi)
+    return count + _merge(src, dst, lo, mid, hi)
+
+
+def merge_sort(items):
+    """
+    Top down merge sort. The list is split in half, each half is sorted and the two
+    are merged. Two list copies of items are made up front and take turns as source
+    and destination, so nothing is copied back after each merge, only once at the end.
+
+    Parameters:
+        items - a mutable sequence (a list, an array or a memoryview) of elements of comparable types.
+
+    Returns:
+        count - the number of comparisons made between elements
+    """
+    work = list(items)
+    count = _merge_sort(work[:], work, 0, len(work))
+    _write_back(items, work)
+    return count
+
+
+def _sift_down(items, root, end, value):
+    """
+    Puts value at items[root] and moves it down the heap items[:end] until it is no
+    smaller than its children.
+
+    Returns:
+        count - the number of comparisons made
+    """
+    count = 0
+    child = 2 * root + 1
+    while child < end:
+        if child + 1 < end:
+            count += 1
+            if items[child] < items[child + 1]:  # the larger child
+                child += 1
+        count += 1
+        if not value < items[child]:
+            break
+        items[root] = items[child]  # move the child up, value goes in once its place is found
+        root = child
+        child = 2 * root + 1
+    items[root] = value
+    return count
+
+
+def heap_sort(items):
+    """
+    Heap sort. The list is made into a max heap, then the largest element is swapped to
+    the end of the heap and the heap shrinks by one, until it is empty.
+
+    Parameters:
+        items - a mutable sequence (a list, an array or a memoryview) of elements of comparable types.
+
+    Returns:
+        count - the number of comparisons made between elements
+    """
+    n = len(items)
+    count = 0
+    for root in range(n // 2 - 1, -1, -1):  # heapify, from the last parent up
+        count += _sift_down(items, root, n, items[root])
+    for end in range(n - 1, 0, -1):
+        value = items[end]
+        items[end] = items[0]  # the largest goes to the end
+        count += _sift_down(items, 0, end, value)
+    return count
+
+
+def quick_sort(items, pivot='median_of_three'):
+    """
+    Quick sort with Hoare's partition. The pivot is moved to the front of the range, two
+    indexes scan towards each other swapping the elements on the wrong side, and the
+    smaller side is sorted first while the larger waits on a stack, so the stack never
+    holds more than log2(n) ranges, however bad the pivots.
+
+    Parameters:
+        items - a mutable sequence (a list, an array or a memoryview) of elements of comparable types.
+        pivot - the pivot strategy, one of PIVOTS: 'first', 'middle', 'median_of_three'
+            (of the first, middle and last elements) or 'random'
+
+    Returns:
+        count - the number of comparisons made between elements
+    """
+    if pivot not in PIVOTS:
+        raise ValueError('Unknown pivot strategy: ' + str(pivot))
+    rng = random.Random(PIVOT_SEED) if pivot == 'random' else None
+
+    count = 0
+    stack = [(0, len(items) - 1)]
+    while stack:
+        lo, hi = stack.pop()
+        while lo < hi:
+            # choose the pivot and move it to items[lo]
+            if pivot == 'middle':
+                p = (lo + hi) // 2
+            elif pivot == 'random':
+                p = rng.randint(lo, hi)
+            elif pivot == 'median_of_three':
+                mid = (lo + hi) // 2
+                a, b, c = items[lo], items[mid], items[hi]
+                count += 2
+                if a < b:
+                    if b < c:
+                        p = mid
+                    else:
+                        count += 1
+                        p = hi if a < c else lo
+                else:
+                    if a < c:
+                        p = lo
+                    else:
+                        count += 1
+                        p = hi if b < c else mid
+            else:
+                p = lo
+            items[lo], items[p] = items[p], items[lo]
+            value = items[lo]
+
+            # Hoare's partition, each scan makes one more comparison than the steps it takes
+            i, j = lo - 1, hi + 1
+            while True:
+                i += 1
+                start = i
+                while items[i] < value:
+                    i += 1
+                count += i - start + 1
+                j -= 1
+                start = j
+                while value < items[j]:
+                    j -= 1
+                count += start - j + 1
+                if i >= j:
+                    break
+                items[i], items[j] = items[j], items[i]
+
+            # items[lo:j + 1] <= value <= items[j + 1:hi + 1], go on with the smaller side
+            if j - lo < hi - j:
+                stack.append((j + 1, hi))
+                hi = j
+            else:
+                stack.append((lo, j))
+                lo = j + 1
+    return count
+
+
+def quick_sort_first(items):
+    """Quick sort with the first element as the pivot, see quick_sort."""
+    return quick_sort(items, 'first')
+
+
+def quick_sort_middle(items):
+    """Quick sort with the middle element as the pivot, see quick_sort."""
+    return quick_sort(items, 'middle')
+
+
+def quick_sort_median_of_three(items):
+    """Quick sort with the median of the first, middle and last elements as the pivot, see quick_sort."""
+    return quick_sort(items, 'median_of_three')
+
+
+def quick_sort_random(items):
+    """Quick sort with a random element as the pivot, see quick_sort."""
+    return quick_sort(items, 'random')
+
+
+def _insertion_sort_run(items, lo, start, hi):
+    """
+    Extends the sorted run items[lo:start] to items[lo:hi] by binary insertion.
+
+    Returns:
+        count - the number of comparisons made
+    """
+    count = 0
+    for k in range(start, hi):
+        value = items[k]
+        left, right = lo, k
+        while left < right:  # the first place whose element is greater than value
+            middle = (left + right) // 2
+            count += 1
+            if value < items[middle]:
+                right = middle
+            else:
+                left = middle + 1
+        items[left + 1:k + 1] = items[left:k]
+        items[left] = value
+    return count
+
+
+def natural_merge_sort(items):
+    """
+    Bottom up natural merge sort, in the manner of Python's own timsort. The list is cut
+    into the runs already in order (a strictly descending run is reversed), runs shorter
+    than MIN_RUN are extended to MIN_RUN by binary insertion, and then neighbouring runs
+    are merged in pairs, a whole pass at a time, until one run is left. Lists that are
+    nearly sorted take close to n comparisons.
+
+    Parameters:
+        items - a mutable sequence (a list, an array or a memoryview) of elements of comparable types.
+
+    Returns:
+        count - the number of comparisons made between elements
+    """
+    work = items
+    items = list(items)  # the runs are found and merged in a list, then copied back into work
+    n = len(items)
+    count = 0
+
+    # find the runs, runs holds the start of each and ends with n
+    runs = []
+    lo = 0
+    while lo < n:
+        runs.append(lo)
+        hi = lo + 1
+        if hi < n:
+            if items[hi] < items[lo]:  # strictly descending, so reversing it is stable
+                while hi + 1 < n and items[hi + 1] < items[hi]:
+                    hi += 1
+                hi += 1
+                items[lo:hi] = items[lo:hi][::-1]
+            else:
+                while hi + 1 < n and not items[hi + 1] < items[hi]:
+                    hi += 1
+                hi += 1
+            count += min(hi, n - 1) - lo  # one comparison per step, and one that ended the run
+        if hi - lo < MIN_RUN and hi < n:
+            end = min(lo + MIN_RUN, n)
+            count += _insertion_sort_run(items, lo, hi, end)
+            hi = end
+        lo = hi
+    runs.append(n)
+
+    # merge neighbouring runs in passes, back and forth between items and one scratch list
+    src, dst = items, items[:]
+    while len(runs) > 2:
+        merged = [0]
+        for r in range(0, len(runs) - 1, 2):
+            lo = runs[r]
+            if r + 2 < len(runs):
+                count += _merge(src, dst, lo, runs[r + 1], runs[r + 2])
+                merged.append(runs[r + 2])
+            else:  # an odd run out is carried over to the next pass
+                dst[lo:n] = src[lo:n]
+                merged.append(n)
+        runs = merged
+        src, dst = dst, src
+    _write_back(work, src)
+    return count
+
+
+if __name__ == '__main__':
+    # Unit testing for counting_nlogn_sorts
+    import time
+
+    print("Unit testing counting_nlogn_sorts")
+
+    sorts = [merge_sort, heap_sort, quick_sort_first, quick_sort_middle, quick_sort_median_of_three,
+             quick_sort_random, natural_merge_sort]
+
+    ran_list = [6, 1, 5, 4]
+    print("\nran_list of Four elements: " + str(ran_list))
+    for sort in sorts:
+        copy = list(ran_list)
+        print(sort.__name__ + ": " + str(sort(copy)) + " comparisons, " + str(copy))
+
+    # every sort sorts, with ties, and a sorted list is cheap for natural merge sort
+    rng = random.Random(2019)
+    for items in [[rng.random() for i in range(5000)], [rng.randint(0, 9) for i in range(5000)],
+                  list(range(5000)), list(range(5000, 0, -1)), []]:
+        for sort in sorts:
+            copy = list(items)
+            sort(copy)
+            if copy != sorted(items):
+                print("Not sorted by " + sort.__name__)
+    print("\nAll sorts sort random, repeated, sorted, reversed and empty lists")
+    print("natural_merge_sort on 5000 sorted elements: " + str(natural_merge_sort(list(range(5000)))) + " comparisons")
+
+    print("\nSeconds for 10^6 random elements")
+    items = [rng.random() for i in range(10 ** 6)]
+    for sort in sorts:
+        copy = list(items)
+        start = time.perf_counter()
+        count = sort(copy)
+        print(sort.__name__ + ": " + str(round(time.perf_counter() - start, 2)) + "s, " + str(count) + " comparisons")
@@ -0,0 +1,114 @@
+"""
+This module thins out long series of (x, y) points before they are plotted, so that no more
+points are drawn than the canvas has pixel columns, while the shape of the series is kept.
+
+Functions:
+
+- lttb(points, threshold): Largest-Triangle-Three-Buckets. Keeps the first and last points
+  and, from each of threshold - 2 buckets in between, the point that makes the largest
+  triangle with the point kept before it and the average of the next bucket.
+
+- min_max_buckets(points, buckets): splits the x range into equal buckets and keeps the
+  lowest and highest point of each, so peaks and dips are never lost.
+"""
+
+
+def lttb(points, threshold):
+    """
+    Downsamples points with Largest-Triangle-Three-Buckets.
+
+    Parameters:
+        points - a list of (x, y) pairs, in increasing order of x
+        threshold - the most points to keep
+
+    Returns:
+        a list of at most threshold of the points, in the same order
+    """
+    if threshold >= len(points) or len(points) <= 2:
+        return list(points)
+    if threshold < 3:
+        return [points[0], points[-1]][:max(threshold, 1)]
+
+    kept = [points[0]]
+    every = (len(points) - 2) / (threshold - 2)  # points per bucket, the ends are not in a bucket
+    a = 0  # index of the point kept last
+
+    for i in range(threshold - 2):
+        # the average of the next bucket is the third corner of the triangle
+        next_start = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, len(points))
+        if next_start >= next_end:  # the last bucket is followed by the last point
+            next_start, next_end = len(points) - 1, len(points)
+        avg_x = sum(points[j][0] for j in range(next_start, next_end)) / (next_end - next_start)
+        avg_y = sum(points[j][1] for j in range(next_start, next_end)) / (next_end - next_start)
+
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        ax, ay = points[a]
+        best_area = -1
+        for j in range(start, end):
+            area = abs((ax - avg_x) * (points[j][1] - ay) - (ax - points[j][0]) * (avg_y - ay))
+            if area > best_area:
+                best_area = area
+                a_next = j
+        kept.append(points[a_next])
+        a = a_next
+
+    kept.append(points[-1])
+    return kept
+
+
+def min_max_buckets(points, buckets):
+    """
+    Downsamples points by keeping the lowest and highest point in each of buckets equal
+    slices of the x range.
+
+    Parameters:
+        points - a list of (x, y) pairs, in increasing order of x
+        buckets - the number of slices, e.g. the number of pixel columns
+
+    Returns:
+        a list of at most 2 * buckets of the points, in the same order
+    """
+    if len(points) <= 2 * buckets or buckets < 1:
+        return list(points)
+
+    first_x, last_x = points[0][0], points[-1][0]
+    width = (last_x - first_x) / buckets or 1
+
+    kept = []
+    low = high = None  # indexes of the lowest and highest point in the current bucket
+    bucket = None
+    for i in range(len(points)):
+        b = min(int((points[i][0] - first_x) / width), buckets - 1)
+        if b != bucket:
+            if bucket is not None:
+                kept.extend(points[j] for j in sorted({low, high}))
+            bucket, low, high = b, i, i
+        else:
+            if points[i][1] < points[low][1]:
+                low = i
+            if points[i][1] > points[high][1]:
+                high = i
+    kept.extend(points[j] for j in sorted({low, high}))
+    return kept
+
+
+if __name__ == '__main__':
+    # Unit testing for downsample
+    import math
+
+    print("Unit testing downsample")
+
+    wave = [(x, math.sin(x / 50) * 100 + (x % 97 == 0) * 300) for x in range(100000)]
+    thin = lttb(wave, 650)
+    print("\nlttb kept " + str(len(thin)) + " of " + str(len(wave)) + " points")
+    print("First and last kept: " + str(thin[0] == wave[0] and thin[-1] == wave[-1]))
+    print("Highest spike kept: " + str(max(y for x, y in thin) == max(y for x, y in wave)))
+
+    thin = min_max_buckets(wave, 650)
+    print("\nmin_max_buckets kept " + str(len(thin)) + " of " + str(len(wave)) + " points")
+    print("Lowest and highest kept: " + str(min(thin, key=lambda p: p[1]) == min(wave, key=lambda p: p[1]) and
+                                            max(thin, key=lambda p: p[1]) == max(wave, key=lambda p: p[1])))
+
+    print("\nShort series unchanged: " + str(lttb(wave[:10], 650) == wave[:10]))
@@ -1,73 +1,191 @@
-"""
-This Module is used for calculating the column averages for the test data.
-it does it by first reading the file and appending each column to a list, calculating the average of that list
-and then appending those to a list of column averages.
-
-Author: Ronan Almeida
-Student Num: 20178025
-Date: 2019-15-11
-"""
-
-
-def get_file_column_averages(filename):
-    """
-    this function given the filename- calculates the column averages. It does this by reading filename
-    parsing it into a 2d list of floats then calculating each column average and appending it to a
-    separate list
-
-    Parameters:
-        filename - a csv file in which contains test data for various sorting passes
-
-    Returns:
-        colavg_list - a list of all the column averages in filename
-    """
-
-    filename = open(filename, 'r')  # open the file for reading
-
-    lines = filename.read().strip().split(
-        '\n')  # strip the filename, and split by each new line into the 2d list'lines'
-    filename.close()  # close the file
-
-    list_num = []  # define list_num - a 2d list of all the numbers in filename as an int
-    currentline = []  # current line - a list of the current line of 'lines' split by commas
-
-    for x in range(len(lines)):  # increment x up to the number of lines
-        currentline.append(lines[x].split(','))  # append the current line split by commas
-        list_num.append([])  # add an empty list for the 2d list
-
-        for y in range(len(currentline[x])):  # for y up to the number of elements in the current line
-            list_num[x].append(int(currentline[x][y]))  # append each element of current line to list_num as an int
-
-    colavg_list = []  # a list of all the column averages
-    for y in range(len(list_num)):  # Since we're calculating the column averages  start with y (helps understanding)
-
-        col_sum = 0  # the sum
-
-        for x in range(len(list_num)):  # for each x going down the column of list_num
-            col_sum += list_num[x][y]  # add that column element to the col_sum
-
-        colavg_list.append(round(col_sum / len(list_num))) # calculate the average using round and append to the list
-
-    return colavg_list # return the list of all column averages
-
-if __name__ == '__main__':
-    # Unit testing for file column_averages
-
-    print("\nUnit testing for get_file_column_averages\n")
-
-    import  collect_function_performance_data
-    from counting_quad_sorts import bubble_sort
-
-    collect_function_performance_data.test_function(bubble_sort, 5, 5) # creating bubble sort test data
-
-    # showing that the test data exists by file io
-    file = open(bubble_sort.__name__+".csv",'r')
-    print("Creating Bubble Sort Data \n" + str(file.readlines())) # displaying it
-    file.close()
-
-    avg_col = get_file_column_averages(bubble_sort.__name__+".csv") # calculating averages
-    print("\n\nHere are the averages for the columns of that bubble sort data \n" + str(avg_col))
-
-    import os # importing os inorder to delete the csv file
-    os.remove(bubble_sort.__name__+'.csv') # deleting the csv file,
-    # in case it may interfer with plotting the actual bubble sort one
+"""
+This Module is used for calculating the column averages for the test data.
+it does it by reading the file one line at a time and adding each element to a running sum for its column,
+then dividing each column's sum by the number of rows that reached it.
+
+Author: Ronan Almeida
+Student Num: 20178025
+Date: 2019-15-11
+"""
+import concurrent.futures
+import functools
+
+import result_file
+
+
+def iter_file_rows(filename):
+    """
+    Reads filename one line at a time and yields each line of test data as a list of ints.
+    Blank lines and comment lines, starting with '#', are skipped. Empty cells, left in the
+    columns an adaptive run stopped sampling, are None. Binary result files (see result_file)
+    are read row by row.
+
+    Parameters:
+        filename - a csv or binary result file in which contains test data for various sorting passes
+
+    Returns:
+        a generator of rows, each row is a list of ints (or None for an empty cell)
+    """
+    if result_file.is_binary(filename):
+        yield from result_file.iter_binary_rows(filename)
+        return
+
+    file = open(filename, 'r')  # open the file for reading
+    try:
+        for line in file:  # only one line is held in memory at a time
+            line = line.strip()
+            if line and not line.startswith('#'):
+                yield [int(cell) if cell else None for cell in line.split(',')]
+    finally:
+        file.close()  # close the file, even if the caller stops early
+
+
+def get_file_column_positions(filename):
+    """
+    Returns the n of each column of a result file run with a size schedule, from its
+    result_file.SIZES_COMMENT line or, for a binary file, its header.
+
+    Parameters:
+        filename - a csv or binary result file
+
+    Returns:
+        positions - a list of the n of each column, or None if the file records none, in
+            which case column n holds the counts for n elements
+    """
+    if result_file.is_binary(filename):
+        return result_file.read_header(filename)[0].get('sizes')
+
+    file = open(filename, 'r')
+    try:
+        for line in file:  # the comment comes before any row
+            line = line.strip()
+            if line.startswith(result_file.SIZES_COMMENT):
+                cells = line[len(result_file.SIZES_COMMENT):].split(',')
+                return [int(cell) for cell in cells if cell]
+            if line and not line.startswith('#'):
+                return None
+    finally:
+        file.close()
+    return None
+
+
+def get_file_column_trials(filename):
+    """
+    Returns the number of trials each column of an adaptive run received, from the
+    result_file.TRIALS_COMMENT line at the end of the file.
+
+    Parameters:
+        filename - a csv or binary result file
+
+    Returns:
+        trials - a list of the number of trials of each column, or None if the file records
+            none, in which case every column has a value in every row
+    """
+    if result_file.is_binary(filename):
+        return None
+
+    trials = None
+    file = open(filename, 'r')
+    try:
+        for line in file:  # the comment comes after the rows
+            if line.startswith(result_file.TRIALS_COMMENT):
+                cells = line.strip()[len(result_file.TRIALS_COMMENT):].split(',')
+                trials = [int(cell) for cell in cells if cell]
+    finally:
+        file.close()
+    return trials
+
+
+def get_file_column_averages(filename, positions=False):
+    """
+    this function given the filename- calculates the column averages. It does this in a single
+    pass over filename, keeping only a running sum and count for every column, so the memory
+    used depends on the number of columns and not on the size of the file. Rows may have any
+    number of columns, a column's average is taken over the rows that reach it and have a
+    value in it.
+    Binary result files are averaged by result_file.get_binary_column_averages instead.
+
+    Parameters:
+        filename - a csv or binary result file in which contains test data for various sorting passes
+        positions - if True, each average is paired with the n of its column, the one recorded
+            in the file (see get_file_column_positions) or else the column index
+
+    Returns:
+        colavg_list - a list of all the column averages in filename, or of (n, average)
+            pairs if positions is True
+    """
+    if positions:
+        colavg_list = get_file_column_averages(filename)
+        xs = get_file_column_positions(filename) or range(len(colavg_list))
+        return list(zip(xs, colavg_list))
+
+    if result_file.is_binary(filename):
+        return result_file.get_binary_column_averages(filename)
+
+    col_sums = []  # the running sum of each column
+    col_counts = []  # the number of rows that reached each column
+
+    for row in iter_file_rows(filename):
+        if len(row) > len(col_sums):  # a row longer than any before it adds new columns
+            col_sums.extend([0] * (len(row) - len(col_sums)))
+            col_counts.extend([0] * (len(row) - len(col_counts)))
+
+        for y in range(len(row)):  # add each element of the row to its column's sum
+            if row[y] is not None:  # an empty cell of a column an adaptive run stopped
+                col_sums[y] += row[y]
+                col_counts[y] += 1
+
+    colavg_list = []  # a list of all the column averages
+    for y in range(len(col_sums)):
+        colavg_list.append(round(col_sums[y] / col_counts[y]))  # calculate the average using round
+
+    return colavg_list # return the list of all column averages
+
+
+def load_column_averages(filenames, workers=None, positions=False):
+    """
+    Calculates the column averages of several files at the same time, each file in its own
+    worker process, since parsing is limited by the processor and not by the disk.
+
+    Parameters:
+        filenames - a list of csv or binary result files
+        workers - the number of worker processes, None uses one per processor
+        positions - as for get_file_column_averages
+
+    Returns:
+        averages - a list with the column averages of each file, in the order of filenames
+    """
+    load = functools.partial(get_file_column_averages, positions=positions)
+    if len(filenames) < 2:  # no point starting a pool for one file
+        return [load(filename) for filename in filenames]
+    executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+    averages = list(executor.map(load, filenames))
+    executor.shutdown()
+    return averages
+
+
+if __name__ == '__main__':
+    # Unit testing for file column_averages
+
+    print("\nUnit testing for get_file_column_averages\n")
+
+    import  collect_function_performance_data
+    from counting_quad_sorts import bubble_sort
+
+    collect_function_performance_data.test_function(bubble_sort, 5, 5) # creating bubble sort test data
+
+    # showing that the test data exists by file io
+    file = open(bubble_sort.__name__+".csv",'r')
+    print("Creating Bubble Sort Data \n" + str(file.readlines())) # displaying it
+    file.close()
+
+    avg_col = get_file_column_averages(bubble_sort.__name__+".csv") # calculating averages
+    print("\n\nHere are the averages for the columns of that bubble sort data \n" + str(avg_col))
+
+    # loading the same file three times over in parallel gives the same averages
+    parallel = load_column_averages([bubble_sort.__name__ + ".csv"] * 3)
+    print("\nParallel loading matches: " + str(parallel == [avg_col] * 3))
+
+    import os # importing os inorder to delete the csv file
+    os.remove(bubble_sort.__name__+'.csv') # deleting the csv file,
+    # in case it may interfer with plotting the actual bubble sort one
@@ -0,0 +1,171 @@
+"""
+This Module is used for calculating the spread of the test data in each column, next to the
+plain averages of file_column_averages. In one pass over the file it keeps, for every column,
+a running mean and variance (Welford's method), the min and max, and a small quantile sketch
+for the percentiles. The sketch holds at most a few hundred values per column however many
+rows the file has, and its percentiles are exact while a column has no more rows than the
+sketch's capacity.
+"""
+import file_column_averages
+
+# Constants
+DEFAULT_QUANTILES = (0.5, 0.9, 0.99)  # The percentiles reported for each column
+DEFAULT_SKETCH_CAPACITY = 256  # Values held in each level of a column's quantile sketch
+
+
+def sketch_add(sketch, value, capacity=DEFAULT_SKETCH_CAPACITY):
+    """
+    Adds value to a quantile sketch. A sketch is a list of levels, a value in level h stands
+    for 2 ** h values of the column. When a level fills up it is sorted and every other value
+    is promoted to the level above, alternating which half is kept so the sketch stays unbiased.
+
+    Parameters:
+        sketch - the sketch, a list of [values, toggle] levels, start with []
+        value - the value to add
+        capacity - the number of values a level holds before it is compacted
+    """
+    if not sketch:
+        sketch.append([[], 0])
+    sketch[0][0].append(value)
+
+    h = 0
+    while len(sketch[h][0]) >= capacity:
+        level = sketch[h]
+        level[0].sort()
+        promoted = level[0][level[1]::2]  # every other value, starting at the toggle
+        level[1] = 1 - level[1]
+        level[0] = []
+        if h + 1 == len(sketch):
+            sketch.append([[], 0])
+        sketch[h + 1][0].extend(promoted)
+        h += 1
+
+
+def sketch_quantiles(sketch, quantiles):
+    """
+    Reads quantiles out of a sketch built with sketch_add.
+
+    Parameters:
+        sketch - the sketch
+        quantiles - a sequence of fractions between 0 and 1
+
+    Returns:
+        a list with the value of each quantile, or None for each if the sketch is empty
+    """
+    weighted = []  # (value, weight) pairs
+    for h in range(len(sketch)):
+        for value in sketch[h][0]:
+            weighted.append((value, 1 << h))
+    if not weighted:
+        return [None] * len(quantiles)
+    weighted.sort()
+
+    total = 0
+    for value, weight in weighted:
+        total += weight
+
+    results = []
+    for q in quantiles:
+        target = q * total  # the smallest value whose cumulative weight reaches target
+        cumulative = 0
+        for value, weight in weighted:
+            cumulative += weight
+            if cumulative >= target:
+                break
+        results.append(value)
+    return results
+
+
+def get_file_column_statistics(filename, quantiles=DEFAULT_QUANTILES, capacity=DEFAULT_SKETCH_CAPACITY):
+    """
+    this function given the filename- calculates the spread of every column in a single pass.
+
+    Parameters:
+        filename - a csv or binary result file in which contains test data for various sorting passes
+        quantiles - the percentiles to report, as fractions between 0 and 1
+        capacity - the capacity of each level of the quantile sketches (see sketch_add)
+
+    Returns:
+        stats_list - a list with one dict per column, holding:
+            'count' - the number of rows with a value in the column
+            'mean' - the mean of the column
+            'variance' - the sample variance of the column, 0.0 for fewer than two rows
+            'min', 'max' - the smallest and largest values in the column
+            'p50', 'p90', ... - one key per quantile, e.g. 0.99 becomes 'p99'
+    """
+    counts = []  # the running count, mean and sum of squared differences of each column
+    means = []
+    squares = []
+    mins = []
+    maxs = []
+    sketches = []
+
+    for row in file_column_averages.iter_file_rows(filename):
+        for y in range(len(counts), len(row)):  # a row longer than any before it adds new columns
+            counts.append(0)
+            means.append(0.0)
+            squares.append(0.0)
+            mins.append(None)
+            maxs.append(None)
+            sketches.append([])
+
+        for y in range(len(row)):
+            value = row[y]
+            if value is None:  # an empty cell of a column an adaptive run stopped
+                continue
+            counts[y] += 1
+            delta = value - means[y]  # Welford's update of the mean and variance
+            means[y] += delta / counts[y]
+            squares[y] += delta * (value - means[y])
+            if mins[y] is None or value < mins[y]:
+                mins[y] = value
+            if maxs[y] is None or value > maxs[y]:
+                maxs[y] = value
+            sketch_add(sketches[y], value, capacity)
+
+    names = ['p' + format(q * 100, 'g') for q in quantiles]  # 0.5 becomes 'p50'
+    stats_list = []
+    for y in range(len(counts)):
+        stats = {'count': counts[y],
+                 'mean': means[y],
+                 'variance': squares[y] / (counts[y] - 1) if counts[y] > 1 else 0.0,
+                 'min': mins[y],
+                 'max': maxs[y]}
+        values = sketch_quantiles(sketches[y], quantiles)
+        for i in range(len(names)):
+            stats[names[i]] = values[i]
+        stats_list.append(stats)
+
+    return stats_list
+
+
+if __name__ == '__main__':
+    # Unit testing for file_column_statistics
+    import os
+    import statistics
+
+    import collect_function_performance_data
+    from counting_quad_sorts import insertion_sort
+
+    print("\nUnit testing for get_file_column_statistics\n")
+
+    collect_function_performance_data.test_function(insertion_sort, 12, 50, seed=2019)
+    filename = insertion_sort.__name__ + '.csv'
+    stats_list = get_file_column_statistics(filename)
+    print("Statistics of the last column:\n" + str(stats_list[-1]))
+
+    # compare against the exact values worked out from the whole column
+    column = [row[-1] for row in file_column_averages.iter_file_rows(filename)]
+    print("\nMean matches: " + str(abs(stats_list[-1]['mean'] - statistics.mean(column)) < 1e-9))
+    print("Variance matches: " + str(abs(stats_list[-1]['variance'] - statistics.variance(column)) < 1e-6))
+    print("Median matches: " + str(stats_list[-1]['p50'] == sorted(column)[24]))
+
+    # a sketch far over its capacity still gives close percentiles
+    sketch = []
+    for value in range(100000):
+        sketch_add(sketch, value, 64)
+    print("\nSketch of 0..99999 with capacity 64: p50, p90, p99 = " +
+          str(sketch_quantiles(sketch, DEFAULT_QUANTILES)) + ", holding " +
+          str(sum(len(level[0]) for level in sketch)) + " values")
+
+    os.remove(filename)
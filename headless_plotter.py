@@ -0,0 +1,363 @@
+"""
+This module is a headless backend for plotter. plot() takes the same parameters as
+plotter.plot() and returns the same dict of functions, but nothing is shown on screen and
+tkinter is never imported. The drawing is kept in memory and rendered on demand as SVG, or
+as a PNG or PPM raster, by two extra functions in the dict:
+
+    - 'render'(fmt='svg') returns the drawing as bytes, fmt is 'svg', 'png' or 'ppm'
+    - 'save'(filename) writes the drawing to filename, the format is taken from its extension
+
+The raster formats draw points, lines, axes and plot_points images but leave out text, which
+needs a font; use SVG when the labels matter.
+
+Colours are Tk colour names (for the names this project uses, and the common ones) or
+'#rrggbb' strings.
+"""
+import base64
+import struct
+import zlib
+
+import plotter
+
+# Constants
+DEFAULT_BACKGROUND_RGB = (0xd9, 0xd9, 0xd9)  # Tk's own default canvas colour, used when bg is None
+DEFAULT_FONT_SIZE = 10  # Point size of text when put_text is given no size
+COLOURS = {
+    'black': (0, 0, 0), 'white': (255, 255, 255), 'red': (255, 0, 0),
+    'green': (0, 255, 0), 'blue': (0, 0, 255), 'yellow': (255, 255, 0),
+    'cyan': (0, 255, 255), 'magenta': (255, 0, 255), 'orange': (255, 165, 0),
+    'purple': (160, 32, 240), 'pink': (255, 192, 203), 'brown': (165, 42, 42),
+    'navy': (0, 0, 128), 'gray': (190, 190, 190), 'grey': (190, 190, 190),
+    'lightgray': (211, 211, 211), 'lightgrey': (211, 211, 211),
+    'darkgray': (169, 169, 169), 'darkgrey': (169, 169, 169),
+    'darkgreen': (0, 100, 0), 'darkblue': (0, 0, 139), 'darkred': (139, 0, 0),
+    'deeppink': (255, 20, 147), 'hotpink': (255, 105, 180), 'lightcoral': (240, 128, 128),
+    'mintcream': (245, 255, 250), 'bisque': (255, 228, 196), 'thistle1': (255, 225, 255),
+    'darkseagreen1': (193, 255, 193), 'lightblue': (173, 216, 230), 'skyblue': (135, 206, 235),
+    'forestgreen': (34, 139, 34), 'gold': (255, 215, 0), 'violet': (238, 130, 238),
+    'steelblue': (70, 130, 180), 'teal': (0, 128, 128), 'olive': (128, 128, 0),
+    'maroon': (176, 48, 96), 'salmon': (250, 128, 114), 'tomato': (255, 99, 71),
+}
+
+
+def colour_rgb(colour):
+    """
+    Returns the (red, green, blue) of a Tk colour name or a '#rrggbb' string.
+    Names are matched the way Tk matches them, ignoring case and spaces.
+    """
+    if colour.startswith('#') and len(colour) == 7:
+        return int(colour[1:3], 16), int(colour[3:5], 16), int(colour[5:7], 16)
+    key = colour.replace(' ', '').lower()
+    if key not in COLOURS:
+        raise ValueError('unknown color name "' + colour + '"')
+    return COLOURS[key]
+
+
+def _hex(rgb):
+    """Returns rgb as a '#rrggbb' string."""
+    return '#%02x%02x%02x' % rgb
+
+
+class Master:
+    """Stands in for the tkinter window of plotter.plot_on."""
+
+    def winfo_rgb(self, colour):
+        """Returns colour with 16 bits per channel, as tkinter does."""
+        return tuple(c * 257 for c in colour_rgb(colour))
+
+    def destroy(self):
+        """Nothing to destroy without a window."""
+
+    def mainloop(self):
+        """Nothing to wait for without a window."""
+
+
+class PhotoImage:
+    """Stands in for tkinter.PhotoImage, keeping the painted pixels in a dict."""
+
+    def __init__(self, master=None, width=0, height=0):
+        self.width = width
+        self.height = height
+        self.pixels = {}  # (x, y) -> (red, green, blue)
+
+    def put(self, colour, to):
+        """Paints the rectangle to = (left, top, right, bottom) with colour."""
+        rgb = colour_rgb(colour)
+        left, top, right, bottom = to
+        for y in range(top, bottom):
+            for x in range(left, right):
+                self.pixels[(x, y)] = rgb
+
+
+class Canvas:
+    """Stands in for tkinter.Canvas, recording the items drawn in order."""
+
+    def __init__(self, width, height, bg):
+        self.width = width
+        self.height = height
+        self.bg = DEFAULT_BACKGROUND_RGB if bg is None else colour_rgb(bg)
+        self.items = []
+
+    def create_oval(self, x0, y0, x1, y1, outline='black', fill=''):
+        self.items.append(('oval', (x0, y0, x1, y1), colour_rgb(fill or outline)))
+        return len(self.items)
+
+    def create_line(self, *coords, fill='black', width=1):
+        self.items.append(('line', coords, colour_rgb(fill), width))
+        return len(self.items)
+
+    def create_text(self, x, y, text='', fill='black', anchor='w', font=None):
+        size = DEFAULT_FONT_SIZE if font is None else font[1]
+        self.items.append(('text', (x, y), colour_rgb(fill), text, size))
+        return len(self.items)
+
+    def create_image(self, x, y, image=None, anchor='nw'):
+        self.items.append(('image', (x, y), image))
+        return len(self.items)
+
+    def find_all(self):
+        return tuple(i + 1 for i in range(len(self.items)) if self.items[i] is not None)
+
+    def delete(self, item):
+        self.items[item - 1] = None  # ids stay the positions of the items
+
+    def bind(self, sequence, callback):
+        """A headless canvas is never resized, so callbacks are never called."""
+
+    def pack(self, **options):
+        """Nothing to lay out without a window."""
+
+    def update(self):
+        """Nothing to redraw without a window."""
+
+
+def _png(width, height, rows, channels):
+    """Encodes rows (a list of bytes, one per pixel row) as a PNG file."""
+    def chunk(kind, data):
+        return (struct.pack('>I', len(data)) + kind + data +
+                struct.pack('>I', zlib.crc32(kind + data) & 0xffffffff))
+
+    colour_type = 2 if channels == 3 else 6  # RGB or RGBA
+    raw = b''.join(b'\x00' + row for row in rows)  # filter type 0 on every row
+    return (b'\x89PNG\r\n\x1a\n' +
+            chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, colour_type, 0, 0, 0)) +
+            chunk(b'IDAT', zlib.compress(raw, 6)) +
+            chunk(b'IEND', b''))
+
+
+def _clip(x0, y0, x1, y1, width, height):
+    """Clips the segment (x0, y0)-(x1, y1) to the canvas (Liang-Barsky), or returns None."""
+    t0, t1 = 0.0, 1.0
+    dx, dy = x1 - x0, y1 - y0
+    for p, q in ((-dx, x0), (dx, width - 1 - x0), (-dy, y0), (dy, height - 1 - y0)):
+        if p == 0:
+            if q < 0:
+                return None
+        else:
+            t = q / p
+            if p < 0:
+                t0 = max(t0, t)
+            else:
+                t1 = min(t1, t)
+            if t0 > t1:
+                return None
+    return x0 + t0 * dx, y0 + t0 * dy, x0 + t1 * dx, y0 + t1 * dy
+
+
+def rasterise(canv):
+    """
+    Draws the items of canv into a raster.
+
+    Returns:
+        pixels - a bytearray of width * height RGB triples, row by row
+    """
+    width, height = canv.width, canv.height
+    pixels = bytearray(bytes(canv.bg) * (width * height))
+
+    def paint(x, y, rgb):
+        if 0 <= x < width and 0 <= y < height:
+            i = (y * width + x) * 3
+            pixels[i:i + 3] = bytes(rgb)
+
+    def stamp(x, y, size, rgb):
+        """Paints a size by size square centred on (x, y)."""
+        start = -(size // 2)
+        for dy in range(start, start + size):
+            for dx in range(start, start + size):
+                paint(x + dx, y + dy, rgb)
+
+    for item in canv.items:
+        if item is None:  # deleted
+            continue
+        if item[0] == 'oval':
+            x0, y0, x1, y1 = item[1]
+            cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+            rx, ry = max((x1 - x0) / 2, 0.5), max((y1 - y0) / 2, 0.5)
+            for y in range(int(y0), int(y1) + 1):
+                for x in range(int(x0), int(x1) + 1):
+                    if ((x + 0.5 - cx) / rx) ** 2 + ((y + 0.5 - cy) / ry) ** 2 <= 1:
+                        paint(x, y, item[2])
+
+        elif item[0] == 'line':
+            coords, rgb, line_width = item[1], item[2], max(int(round(item[3])), 1)
+            for i in range(0, len(coords) - 2, 2):
+                segment = _clip(coords[i], coords[i + 1], coords[i + 2], coords[i + 3], width, height)
+                if segment is None:
+                    continue
+                x0, y0, x1, y1 = [int(round(c)) for c in segment]
+                dx, dy = abs(x1 - x0), -abs(y1 - y0)  # Bresenham's line algorithm
+                sx, sy = (1 if x0 < x1 else -1), (1 if y0 < y1 else -1)
+                error = dx + dy
+                while True:
+                    stamp(x0, y0, line_width, rgb)
+                    if x0 == x1 and y0 == y1:
+                        break
+                    doubled = 2 * error
+                    if doubled >= dy:
+                        error += dy
+                        x0 += sx
+                    if doubled <= dx:
+                        error += dx
+                        y0 += sy
+
+        elif item[0] == 'image':
+            left, top = item[1]
+            for (x, y), rgb in item[2].pixels.items():
+                paint(left + x, top + y, rgb)
+
+    return pixels
+
+
+def _image_href(image):
+    """Returns a plot_points image as a transparent PNG data URI, for SVG."""
+    rows = []
+    for y in range(image.height):
+        row = bytearray(image.width * 4)
+        for x in range(image.width):
+            rgb = image.pixels.get((x, y))
+            if rgb is not None:
+                row[x * 4:x * 4 + 4] = bytes(rgb) + b'\xff'
+        rows.append(bytes(row))
+    return 'data:image/png;base64,' + base64.b64encode(_png(image.width, image.height, rows, 4)).decode('ascii')
+
+
+def to_svg(canv):
+    """Returns the items of canv as an SVG document."""
+    def escape(text):
+        return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+    parts = ['<svg xmlns="http://www.w3.org/2000/svg" width="%d" height="%d">' % (canv.width, canv.height),
+             '<rect width="100%%" height="100%%" fill="%s"/>' % _hex(canv.bg)]
+    for item in canv.items:
+        if item is None:  # deleted
+            continue
+        if item[0] == 'oval':
+            x0, y0, x1, y1 = item[1]
+            parts.append('<ellipse cx="%g" cy="%g" rx="%g" ry="%g" fill="%s"/>' %
+                         ((x0 + x1) / 2, (y0 + y1) / 2, (x1 - x0) / 2, (y1 - y0) / 2, _hex(item[2])))
+        elif item[0] == 'line':
+            coords = item[1]
+            points = ' '.join('%g,%g' % (coords[i], coords[i + 1]) for i in range(0, len(coords), 2))
+            parts.append('<polyline points="%s" fill="none" stroke="%s" stroke-width="%g"/>' %
+                         (points, _hex(item[2]), item[3]))
+        elif item[0] == 'text':
+            (x, y), rgb, text, size = item[1], item[2], item[3], item[4]
+            lines = str(text).split('\n')
+            # Tk centres the whole block of lines vertically on y
+            spans = ''.join('<tspan x="%g" dy="%s">%s</tspan>' %
+                            (x, '%gem' % (-0.6 * (len(lines) - 1)) if i == 0 else '1.2em', escape(lines[i]))
+                            for i in range(len(lines)))
+            parts.append('<text x="%g" y="%g" fill="%s" font-size="%gpt" dominant-baseline="middle">%s</text>' %
+                         (x, y, _hex(rgb), size, spans))
+        elif item[0] == 'image':
+            image = item[2]
+            parts.append('<image x="%g" y="%g" width="%d" height="%d" href="%s"/>' %
+                         (item[1][0], item[1][1], image.width, image.height, _image_href(image)))
+    parts.append('</svg>')
+    return '\n'.join(parts)
+
+
+def render(canv, fmt='svg'):
+    """
+    Renders the items of canv.
+
+    Parameters:
+        canv - a headless Canvas
+        fmt - 'svg', 'png' or 'ppm'
+
+    Returns:
+        the rendered file as bytes
+    """
+    if fmt == 'svg':
+        return to_svg(canv).encode('utf-8')
+    if fmt in ('png', 'ppm'):
+        pixels = rasterise(canv)
+        if fmt == 'ppm':
+            return b'P6\n%d %d\n255\n' % (canv.width, canv.height) + bytes(pixels)
+        row_size = canv.width * 3
+        rows = [bytes(pixels[y * row_size:(y + 1) * row_size]) for y in range(canv.height)]
+        return _png(canv.width, canv.height, rows, 3)
+    raise ValueError('Unknown format: ' + str(fmt))
+
+
+def plot(title='Plot',
+         canv_width=plotter.DEFAULT_CANV_WIDTH,
+         canv_height=plotter.DEFAULT_CANV_HEIGHT,
+         origin_x=plotter.DEFAULT_CANV_WIDTH // 2,
+         origin_y=plotter.DEFAULT_CANV_HEIGHT // 2,
+         scale_x=plotter.DEFAULT_SCALE_X,
+         scale_y=plotter.DEFAULT_SCALE_Y,
+         bg=None):
+    """
+    Creates an in-memory canvas. Takes the same parameters as plotter.plot() and returns the
+    same dict of functions, plus 'render' and 'save' (see the module docstring). title is
+    kept as the title of the drawing.
+    """
+    plotter.check_settings(canv_width, canv_height, scale_x, scale_y)
+    canv = Canvas(canv_width + 1, canv_height + 1, bg)
+    functions = plotter.plot_on(Master(), canv, PhotoImage, canv_width, canv_height,
+                                origin_x, origin_y, scale_x, scale_y)
+
+    def render_plot(fmt='svg'):
+        """Returns the drawing as bytes in fmt, 'svg', 'png' or 'ppm'."""
+        return render(canv, fmt)
+
+    def save(filename):
+        """Writes the drawing to filename, in the format named by its extension."""
+        out_file = open(filename, 'wb')
+        out_file.write(render(canv, filename.rsplit('.', 1)[-1].lower()))
+        out_file.close()
+
+    functions['title'] = title
+    functions['render'] = render_plot
+    functions['save'] = save
+    return functions
+
+
+if __name__ == '__main__':
+    # Unit testing for headless_plotter, draws the same plots as plotter.main()
+    import math
+    import os
+    import sys
+
+    print("Unit testing headless_plotter")
+
+    plot_1 = plot(title='Test Plot', bg='bisque')
+    plot_1['plot_point'](math.pi, 0, 10, 'yellow')
+    plot_1['plot_point'](math.pi / 2, 0, 10, 'red')
+    plot_1['plot_point'](0, 1, 10, 'blue')
+    plot_1['draw_axes'](tick_length=-4, tick_interval_x=math.pi)
+    plot_1['plot_function'](math.sin, colour='green')
+    plot_1['plot_function'](math.cos, colour='purple')
+    plot_1['plot_points']([(x / 10, math.tanh(x / 10)) for x in range(-80, 80)], colour='navy')
+    plot_1['plot_points']([(x / 10, -2) for x in range(-80, 80, 4)], diam=3, colour='deep pink',
+                          style='image')
+    plot_1['put_text']('Various points and functions', x=-7.5, y=-3, size=16, colour='green')
+    plot_1['block']()
+
+    for fmt in ['svg', 'png', 'ppm']:
+        plot_1['save']('headless_test.' + fmt)
+        print("headless_test." + fmt + ": " + str(os.path.getsize('headless_test.' + fmt)) + " bytes")
+        os.remove('headless_test.' + fmt)
+
+    print("\ntkinter imported: " + str('tkinter' in sys.modules))
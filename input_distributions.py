@@ -0,0 +1,177 @@
+"""
+This module makes the input lists the sorts are tested on. Besides uniform random floats,
+what test_function has always used, it has the best and worst cases that matter for the
+sorts: already sorted, reversed, nearly sorted, few unique values, sawtooth and organ pipe.
+
+generate(name, rng, n) yields the n values of one input lazily, drawing any randomness
+from rng (the random module or a random.Random). 'uniform' draws exactly what
+[rng.random() for x in range(n)] draws, so existing result files are unchanged.
+
+The first m values of an input of the PREFIX_CLOSED distributions are themselves an input
+of the same distribution, so a trial can draw one input and sort its prefixes. The others
+have a shape that depends on n (the first half of an organ pipe is ascending), so a trial
+must generate a new input for each n.
+
+bulk(name, rng, n) makes the same input as generate, drawing the same from rng, as a NumPy
+array. The shapes are built by whole-array arithmetic instead of one float at a time, so
+it is the faster way to make the long inputs of the shape distributions that run_trial
+builds anew for every n. It needs NumPy, which is optional.
+
+All values are floats in [0, 1).
+"""
+import math
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional, only bulk() needs it
+    numpy = None
+
+# Constants
+DEFAULT_SWAPS = 10  # random swaps made in a nearly sorted input
+DEFAULT_UNIQUE = 8  # distinct values in a few unique input
+DEFAULT_TEETH = 4  # ascending runs in a sawtooth input
+BULK_MIN_N = 1000  # shortest input worth making with bulk(), below it generate() is as fast
+
+
+def uniform(rng, n):
+    """Yields n uniform random floats."""
+    for i in range(n):
+        yield rng.random()
+
+
+def ascending(rng, n):
+    """Yields n distinct floats in ascending order."""
+    for i in range(n):
+        yield i / n
+
+
+def descending(rng, n):
+    """Yields n distinct floats in descending order."""
+    for i in range(n):
+        yield (n - 1 - i) / n
+
+
+def nearly_sorted(rng, n, k=DEFAULT_SWAPS):
+    """Yields an ascending input of n floats in which k random pairs of elements were swapped."""
+    values = [i / n for i in range(n)]
+    for swap in range(k if n > 1 else 0):
+        a, b = rng.randrange(n), rng.randrange(n)
+        values[a], values[b] = values[b], values[a]
+    yield from values
+
+
+def few_unique(rng, n, unique=DEFAULT_UNIQUE):
+    """Yields n floats drawn at random from only unique distinct values."""
+    for i in range(n):
+        yield rng.randrange(unique) / unique
+
+
+def sawtooth(rng, n, teeth=DEFAULT_TEETH):
+    """Yields n floats in teeth ascending runs of equal length."""
+    period = max(math.ceil(n / teeth), 1)
+    for i in range(n):
+        yield (i % period) / period
+
+
+def organ_pipe(rng, n):
+    """Yields n floats ascending to the middle and then descending again."""
+    for i in range(n):
+        yield min(i, n - 1 - i) / n
+
+
+DISTRIBUTIONS = {  # name -> generator function(rng, n, **options)
+    'uniform': uniform,
+    'sorted': ascending,
+    'reversed': descending,
+    'nearly_sorted': nearly_sorted,
+    'few_unique': few_unique,
+    'sawtooth': sawtooth,
+    'organ_pipe': organ_pipe,
+}
+PREFIX_CLOSED = ('uniform', 'sorted', 'few_unique')  # every prefix of an input is an input of the distribution
+
+
+def generate(name, rng, n, **options):
+    """
+    Returns a generator of the n values of one input.
+
+    Parameters:
+        name - one of the DISTRIBUTIONS
+        rng - the random module or a random.Random, the source of any randomness
+        n - the length of the input
+        options - options of the distribution: k for nearly_sorted, unique for
+            few_unique and teeth for sawtooth
+
+    Returns:
+        a generator of n floats
+    """
+    try:
+        distribution = DISTRIBUTIONS[name]
+    except KeyError:
+        raise ValueError('Unknown distribution: ' + str(name)) from None
+    return distribution(rng, n, **options)
+
+
+def bulk(name, rng, n, k=DEFAULT_SWAPS, unique=DEFAULT_UNIQUE, teeth=DEFAULT_TEETH):
+    """
+    Makes the n values of one input at once with NumPy. They are the values of
+    generate(name, rng, n), and the same numbers are drawn from rng: only the shapes are
+    computed on whole arrays, the draws of uniform, few_unique and the swaps of
+    nearly_sorted are still made one at a time from rng.
+
+    Parameters:
+        name - one of the DISTRIBUTIONS
+        rng - the random module or a random.Random, the source of any randomness
+        n - the length of the input
+        k, unique, teeth - the options of nearly_sorted, few_unique and sawtooth
+
+    Returns:
+        a numpy array of n floats
+    """
+    if numpy is None:
+        raise ImportError('bulk() needs NumPy, use generate() without it')
+    if name not in DISTRIBUTIONS:
+        raise ValueError('Unknown distribution: ' + str(name))
+    positions = numpy.arange(n)
+
+    if name == 'uniform':
+        return numpy.fromiter(uniform(rng, n), float, n)
+    if name == 'few_unique':
+        return numpy.fromiter(few_unique(rng, n, unique), float, n)
+
+    if name == 'sorted' or name == 'nearly_sorted':
+        values = positions / n
+    elif name == 'reversed':
+        values = (n - 1 - positions) / n
+    elif name == 'sawtooth':
+        period = max(math.ceil(n / teeth), 1)
+        values = (positions % period) / period
+    else:  # organ_pipe
+        values = numpy.minimum(positions, n - 1 - positions) / n
+
+    if name == 'nearly_sorted':
+        for swap in range(k if n > 1 else 0):  # the same draws as nearly_sorted
+            a, b = rng.randrange(n), rng.randrange(n)
+            values[[a, b]] = values[[b, a]]
+    return values
+
+
+if __name__ == '__main__':
+    # Unit testing for input_distributions
+    import random
+
+    print("Unit testing input_distributions")
+
+    for name in DISTRIBUTIONS:
+        print(name + ": " + str([round(x, 3) for x in generate(name, random.Random(2019), 12)]))
+
+    # uniform must draw exactly what test_function always drew
+    random.seed(2019)
+    old = [random.random() for x in range(100)]
+    random.seed(2019)
+    print("\nuniform draws the same values as before: " + str(list(generate('uniform', random, 100)) == old))
+
+    if numpy is not None:
+        for name in DISTRIBUTIONS:
+            same = bulk(name, random.Random(2019), 5000).tolist() == list(generate(name, random.Random(2019), 5000))
+            print("bulk " + name + " makes the same input as generate: " + str(same))
@@ -0,0 +1,173 @@
+"""
+Opt-in profiling of test data generation, to find out where the time and memory of a job
+go and so which sort kernels are worth optimising.
+
+    with profiling.profiled('profile_report.txt'):
+        collect_function_performance_data.test_function(bubble_sort, 500, 20)
+
+Inside profiled(), test_function wraps its sort with wrap(), which records the calls, the
+time and, with tracemalloc, the peak memory allocated by the sort, in buckets of (sort, n)
+with n grouped by powers of two. The whole job also runs under cProfile. When the block
+ends, a report of the buckets and of the functions where the most time went is written.
+
+Outside profiled(), wrap() returns the sort itself, so there is no cost at all when
+profiling is off. The trials of a profiled job run in the calling process, since the
+profilers cannot see into worker processes.
+"""
+import contextlib
+import cProfile
+import functools
+import io
+import pstats
+import time
+import tracemalloc
+
+# Constants
+DEFAULT_REPORT = 'profile_report.txt'  # The report file profiled() writes
+DEFAULT_TOP = 25  # Number of functions listed in the hot spots of the report
+
+_session = [None]  # the profiling session in progress, None when profiling is off
+
+
+def active():
+    """Returns True inside a profiled() block."""
+    return _session[0] is not None
+
+
+def bucket(n):
+    """Returns the (low, high) power of two range of sizes n is grouped in, low <= n < high."""
+    if n == 0:
+        return 0, 1
+    low = 1 << (n.bit_length() - 1)
+    return low, low * 2
+
+
+def wrap(fn):
+    """
+    Returns fn, recorded by the profiling session when one is in progress.
+
+    Parameters:
+        fn - a counting sort
+
+    Returns:
+        fn itself when profiling is off, otherwise a function of the same name that calls
+        fn and adds its time and peak allocation to the (sort, n) bucket of the session
+    """
+    session = _session[0]
+    if session is None:
+        return fn
+
+    buckets = session['buckets']
+
+    @functools.wraps(fn)
+    def recorded(items):
+        key = (fn.__name__, bucket(len(items)))
+        if session['memory']:
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        start = time.perf_counter_ns()
+        result = fn(items)
+        elapsed = time.perf_counter_ns() - start
+        peak = tracemalloc.get_traced_memory()[1] - before if session['memory'] else 0
+
+        record = buckets.get(key)
+        if record is None:
+            record = buckets[key] = {'calls': 0, 'ns': 0, 'peak': 0}
+        record['calls'] += 1
+        record['ns'] += elapsed
+        if peak > record['peak']:
+            record['peak'] = peak
+        return result
+
+    return recorded
+
+
+def format_report(session, top=DEFAULT_TOP):
+    """
+    Returns the report of a profiling session as text: a table of the (sort, n) buckets
+    and, if cProfile ran, the top functions by their own time.
+    """
+    lines = ['Profile report', '',
+             'Sort calls by (sort, n), n grouped by powers of two'
+             + ('' if session['memory'] else ', no memory tracing'), '',
+             format('sort', '<28') + format('n', '>16') + format('calls', '>9') +
+             format('total ms', '>12') + format('mean us', '>12') + format('peak KiB', '>11')]
+    for (name, (low, high)), record in sorted(session['buckets'].items()):
+        lines.append(format(name, '<28') + format(str(low) + '..' + str(high - 1), '>16') +
+                     format(record['calls'], '>9') +
+                     format(record['ns'] / 1e6, '>12.2f') +
+                     format(record['ns'] / record['calls'] / 1e3, '>12.1f') +
+                     format(record['peak'] / 1024, '>11.1f'))
+
+    if session['profile'] is not None:
+        stream = io.StringIO()
+        stats = pstats.Stats(session['profile'], stream=stream)
+        stats.sort_stats('tottime').print_stats(top)
+        lines += ['', 'Hot spots of the whole job (cProfile, by own time)', stream.getvalue()]
+    return '\n'.join(lines) + '\n'
+
+
+@contextlib.contextmanager
+def profiled(report=DEFAULT_REPORT, cpu=True, memory=True, top=DEFAULT_TOP):
+    """
+    Profiles the test data generated inside the with block and writes a report at the end.
+
+    Parameters:
+        report - the name of the report file, None writes none
+        cpu - if True the block runs under cProfile, for the hot spots of the report
+        memory - if True tracemalloc records the peak memory each sort call allocates
+        top - the number of functions listed in the hot spots
+
+    Returns:
+        a context manager, as the with target it gives the session, a dict holding the
+        'buckets' recorded so far
+    """
+    if active():
+        raise RuntimeError('Profiling is already in progress')
+    session = {'buckets': {}, 'memory': memory, 'profile': cProfile.Profile() if cpu else None}
+
+    started_tracing = memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    _session[0] = session
+    if cpu:
+        session['profile'].enable()
+    try:
+        yield session
+    finally:
+        if cpu:
+            session['profile'].disable()
+        _session[0] = None
+        if started_tracing:
+            tracemalloc.stop()
+        if report is not None:
+            file = open(report, 'w')
+            file.write(format_report(session, top))
+            file.close()
+
+
+if __name__ == '__main__':
+    # Unit testing for profiling
+    import os
+    import tempfile
+
+    import collect_function_performance_data
+    import profiling  # the module test_function sees, not this __main__ copy of it
+    from counting_quad_sorts import insertion_sort
+
+    print("Unit testing profiling")
+    print("\nwrap is the sort itself when off: " + str(profiling.wrap(insertion_sort) is insertion_sort))
+
+    out_dir = tempfile.mkdtemp()
+    report = os.path.join(out_dir, profiling.DEFAULT_REPORT)
+    with profiling.profiled(report, top=8):
+        collect_function_performance_data.test_function(insertion_sort, 200, 5, seed=2019, workers=2,
+                                                        out_dir=out_dir)
+
+    file = open(report, 'r')
+    print(file.read())
+    file.close()
+
+    os.remove(report)
+    os.remove(os.path.join(out_dir, insertion_sort.__name__ + '.csv'))
+    os.rmdir(out_dir)
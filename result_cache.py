@@ -0,0 +1,225 @@
+"""
+This module puts a content addressed cache in front of test_function. A result is stored
+under a hash of everything that decides its contents: the source of the modules defining the
+sort function (whole modules, since the registered sorts are thin wrappers around helpers),
+the source of the harness modules, max_n, num_tests, the seed and the output format. Asking
+for the same experiment again copies the stored file into place instead of running it.
+
+The store is a directory holding one file per result and an index.json recording each
+entry's size and when it was last used. When the store grows past its size limit, the
+least recently used entries are evicted. invalidate() empties it by hand.
+
+Only seeded count runs can be cached: without a seed, or when timing, two runs of the
+same experiment do not write the same file.
+"""
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import time
+
+import analytic_quad_sorts
+import collect_function_performance_data
+import input_distributions
+import result_file
+import sort_registry
+
+# Constants
+DEFAULT_CACHE_DIR = '.result_cache'  # Directory of the on-disk store
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # Size limit of the store, least recently used entries go first
+_INDEX_NAME = 'index.json'
+_HARNESS_MODULES = [analytic_quad_sorts, collect_function_performance_data, input_distributions,
+                    result_file]  # hashed in every key
+# test_function options, besides the seed, that change the file written, with their defaults
+_KEYED_OPTIONS = {'out_format': 'csv', 'distribution': 'uniform', 'distribution_options': None, 'sizes': None,
+                  'target_width': None, 'min_tests': collect_function_performance_data.DEFAULT_MIN_TESTS,
+                  'confidence': collect_function_performance_data.DEFAULT_CONFIDENCE}
+
+
+def _module_sources(fn):
+    """
+    Returns a dict of module name -> source of the modules that decide what fn and the
+    harness compute: the module defining fn, the module defining the function it wraps
+    (e.g. the sort inside a sort_registry.CountedSort) and the harness modules.
+    """
+    modules = list(_HARNESS_MODULES)
+    for obj in [fn, getattr(fn, '__wrapped__', None)]:
+        module = inspect.getmodule(obj) if obj is not None else None
+        if module is not None and module not in modules:
+            modules.append(module)
+
+    sources = {}
+    for module in modules:
+        try:
+            sources[module.__name__] = inspect.getsource(module)
+        except (OSError, TypeError):  # no source to read, e.g. builtins for sorted
+            sources[module.__name__] = None
+    return sources
+
+
+def cache_key(fn, max_n, num_tests, seed, **options):
+    """
+    Returns the hash a result is stored under.
+
+    Parameters:
+        fn - the sorting algorithm, the source of its module is part of the key
+        max_n, num_tests, seed - as for test_function
+        options - other test_function options, only those that change the file are used
+
+    Returns:
+        key - a hex string
+    """
+    parts = {'function': fn.__name__,
+             'sources': _module_sources(fn),
+             'max_n': max_n,
+             'num_tests': num_tests,
+             'seed': seed}
+    for name in _KEYED_OPTIONS:
+        parts[name] = options.get(name, _KEYED_OPTIONS[name])
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def _load_index(cache_dir):
+    """Returns the index of the store in cache_dir, a dict of key to entry."""
+    try:
+        file = open(os.path.join(cache_dir, _INDEX_NAME), 'r')
+    except FileNotFoundError:
+        return {}
+    try:
+        return json.load(file)
+    except ValueError:  # a damaged index only loses the cache, not the results
+        return {}
+    finally:
+        file.close()
+
+
+def _save_index(cache_dir, index):
+    """Writes the index of the store in cache_dir, replacing the old one in a single step."""
+    path = os.path.join(cache_dir, _INDEX_NAME)
+    file = open(path + '.tmp', 'w')
+    json.dump(index, file, indent=1, sort_keys=True)
+    file.close()
+    os.replace(path + '.tmp', path)
+
+
+def _evict(cache_dir, index, max_bytes):
+    """Removes the least recently used entries until the store fits in max_bytes."""
+    total = sum(entry['size'] for entry in index.values())
+    for key in sorted(index, key=lambda key: index[key]['last_used']):
+        if total <= max_bytes:
+            break
+        total -= index[key]['size']
+        _remove_entry(cache_dir, index, key)
+
+
+def _remove_entry(cache_dir, index, key):
+    """Removes one entry from the store and from index."""
+    try:
+        os.remove(os.path.join(cache_dir, index[key]['file']))
+    except FileNotFoundError:
+        pass
+    del index[key]
+
+
+def cached_test_function(fn, max_n, num_tests, seed=None, cache_dir=DEFAULT_CACHE_DIR,
+                         max_bytes=DEFAULT_MAX_BYTES, **options):
+    """
+    Writes the same file as test_function, taking it from the cache when the same
+    experiment has been run before.
+
+    Parameters:
+        fn, max_n, num_tests, seed - as for test_function
+        cache_dir - the directory of the store
+        max_bytes - the size limit of the store
+        options - any other test_function options
+
+    Returns:
+        True if the file came from the cache, False if the experiment was run
+    """
+    if isinstance(fn, str):
+        fn = sort_registry.get(fn)
+    if seed is None or options.get('measure', 'count') != 'count':
+        collect_function_performance_data.test_function(fn, max_n, num_tests, seed=seed, **options)
+        return False
+
+    out_name = os.path.join(options.get('out_dir', '.'),
+                            collect_function_performance_data.output_filename(fn, options.get('out_format', 'csv'),
+                                                                              'count',
+                                                                              options.get('distribution', 'uniform')))
+    key = cache_key(fn, max_n, num_tests, seed, **options)
+    os.makedirs(cache_dir, exist_ok=True)
+    index = _load_index(cache_dir)
+
+    if key in index and os.path.exists(os.path.join(cache_dir, index[key]['file'])):
+        directory = os.path.dirname(out_name)
+        if directory:  # '' for the current directory
+            os.makedirs(directory, exist_ok=True)
+        shutil.copyfile(os.path.join(cache_dir, index[key]['file']), out_name)
+        index[key]['last_used'] = time.time()
+        _save_index(cache_dir, index)
+        return True
+
+    collect_function_performance_data.test_function(fn, max_n, num_tests, seed=seed, **options)
+
+    stored_name = key + os.path.splitext(out_name)[1]
+    shutil.copyfile(out_name, os.path.join(cache_dir, stored_name))
+    index[key] = {'file': stored_name,
+                  'function': fn.__name__,
+                  'size': os.path.getsize(out_name),
+                  'last_used': time.time()}
+    _evict(cache_dir, index, max_bytes)
+    _save_index(cache_dir, index)
+    return False
+
+
+def invalidate(name=None, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Removes entries from the store.
+
+    Parameters:
+        name - the name of a sorting algorithm whose results are removed, None removes everything
+        cache_dir - the directory of the store
+
+    Returns:
+        removed - the number of entries removed
+    """
+    index = _load_index(cache_dir)
+    keys = [key for key in index if name is None or index[key]['function'] == name]
+    for key in keys:
+        _remove_entry(cache_dir, index, key)
+    if os.path.isdir(cache_dir):
+        _save_index(cache_dir, index)
+    return len(keys)
+
+
+if __name__ == '__main__':
+    # Unit testing for result_cache
+    import tempfile
+
+    from counting_quad_sorts import insertion_sort
+
+    print("Unit testing result_cache")
+
+    cache_dir = tempfile.mkdtemp()
+    print("\nFirst run came from the cache: " + str(cached_test_function(insertion_sort, 40, 10, 2019, cache_dir)))
+    file = open(insertion_sort.__name__ + '.csv', 'r')
+    first = file.read()
+    file.close()
+
+    os.remove(insertion_sort.__name__ + '.csv')
+    print("Second run came from the cache: " + str(cached_test_function(insertion_sort, 40, 10, 2019, cache_dir)))
+    file = open(insertion_sort.__name__ + '.csv', 'r')
+    print("Same file both times: " + str(file.read() == first))
+    file.close()
+
+    print("Other seed came from the cache: " + str(cached_test_function(insertion_sort, 40, 10, 7, cache_dir)))
+
+    # a store too small for two results keeps only the most recent one
+    cached_test_function(insertion_sort, 40, 10, 8, cache_dir, max_bytes=len(first) + 1)
+    print("Entries left after eviction: " + str(len(_load_index(cache_dir))))
+
+    print("Entries invalidated: " + str(invalidate(insertion_sort.__name__, cache_dir)))
+
+    os.remove(insertion_sort.__name__ + '.csv')
+    shutil.rmtree(cache_dir)
@@ -0,0 +1,276 @@
+"""
+This module reads and writes the binary result format, a compact alternative to the csv
+files written by test_function. A binary result file is:
+
+- the 8 bytes b'CGRESULT',
+- the length of the metadata as a little endian 4 byte unsigned int, then 4 zero bytes,
+- the metadata as a JSON object (function name, max_n, num_tests, seed, ...), padded
+  with spaces to a multiple of 8 bytes,
+- the counts as a row major matrix of little endian int64, one row per test.
+
+Each row holds max_n counts, one for every n in range(max_n), unless the metadata records
+a size schedule under 'sizes', the n of each column, in which case it holds one count per size.
+
+The number of rows is worked out from the size of the file, so a file whose run was
+interrupted can still be read. The matrix is read through mmap (or a NumPy memmap when
+NumPy is installed) so column averages are reductions over the mapped memory, with no
+parsing. export_csv() turns a binary file back into the usual csv file.
+"""
+import array
+import json
+import mmap
+import struct
+import sys
+import time
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional, mmap and memoryview are used without it
+    numpy = None
+
+# Constants
+MAGIC = b'CGRESULT'  # The first bytes of every binary result file
+EXTENSION = '.bin'  # The file extension test_function uses for binary result files
+_PREFIX = struct.Struct('<8sI4x')  # magic, length of the metadata, padding
+_CELL_SIZE = 8  # bytes per count
+SIZES_COMMENT = '#n='  # csv result files with a size schedule start with this line, then the n of each column
+TRIALS_COMMENT = '#trials='  # csv result files of adaptive runs end with this line, then the trials of each column
+
+
+def is_binary(filename):
+    """
+    Tells a binary result file from a csv one by its first bytes.
+
+    Parameters:
+        filename - the name of a result file
+
+    Returns:
+        True if filename starts with MAGIC, False otherwise
+    """
+    file = open(filename, 'rb')
+    start = file.read(len(MAGIC))
+    file.close()
+    return start == MAGIC
+
+
+def binary_writer(out_file, metadata, flush_interval=None, header=True):
+    """
+    Writes the header of a binary result file to out_file and returns a writer for its
+    rows, with the same functions as collect_function_performance_data.row_writer.
+
+    Parameters:
+        out_file - a file opened for writing bytes
+        metadata - a dict that can be saved as JSON, it must hold 'max_n' and, with a size
+            schedule, 'sizes', which decide the number of counts in every row (see row_length)
+        flush_interval - the number of seconds after which out_file is flushed, so that
+            rows already written survive an interruption. None never flushes early.
+        header - if False the header is not written, for out_file opened to append rows
+            to a file that already has one
+
+    Returns:
+        A dict of three functions:
+            'write_row' - write_row(row) writes a list of row_length(metadata) counts
+            'flush' - flushes out_file
+            'close' - flushes and closes out_file
+    """
+    if header:
+        encoded = json.dumps(metadata, sort_keys=True).encode('utf-8')
+        encoded += b' ' * (-len(encoded) % _CELL_SIZE)  # keep the matrix 8 byte aligned
+        out_file.write(_PREFIX.pack(MAGIC, len(encoded)))
+        out_file.write(encoded)
+
+    columns = row_length(metadata)
+    last_flush = [time.monotonic()]
+
+    def flush():
+        """Flushes out_file."""
+        out_file.flush()
+        last_flush[0] = time.monotonic()
+
+    def write_row(row):
+        """Writes a list of row_length(metadata) counts."""
+        if len(row) != columns:
+            raise ValueError('Row of ' + str(len(row)) + ' counts, expected ' + str(columns))
+        cells = array.array('q', row)
+        if sys.byteorder == 'big':
+            cells.byteswap()
+        out_file.write(cells.tobytes())
+        if flush_interval is not None and time.monotonic() - last_flush[0] >= flush_interval:
+            flush()
+
+    def close():
+        """Flushes and closes out_file."""
+        flush()
+        out_file.close()
+
+    return {
+        'write_row': write_row,
+        'flush': flush,
+        'close': close
+    }
+
+
+def row_length(metadata):
+    """Returns the number of counts in each row of a file with this metadata."""
+    sizes = metadata.get('sizes')
+    return metadata['max_n'] if sizes is None else len(sizes)
+
+
+def read_header(filename):
+    """
+    Reads the header of a binary result file.
+
+    Parameters:
+        filename - the name of a binary result file
+
+    Returns:
+        (metadata, offset, rows) - the metadata dict, the byte offset of the matrix and
+            the number of complete rows in the file
+    """
+    file = open(filename, 'rb')
+    magic, length = _PREFIX.unpack(file.read(_PREFIX.size))
+    if magic != MAGIC:
+        file.close()
+        raise ValueError(filename + ' is not a binary result file')
+    metadata = json.loads(file.read(length).decode('utf-8'))
+    offset = _PREFIX.size + length
+    size = file.seek(0, 2)  # the end of the file
+    file.close()
+
+    row_size = row_length(metadata) * _CELL_SIZE
+    rows = (size - offset) // row_size if row_size else metadata.get('num_tests', 0)
+    return metadata, offset, rows
+
+
+def _open_cells(filename):
+    """
+    Maps the matrix of a binary result file into memory.
+
+    Returns:
+        (metadata, rows, cells, close) - cells is a flat memoryview of int64 holding
+            rows * row_length(metadata) counts, close() releases it
+    """
+    metadata, offset, rows = read_header(filename)
+    file = open(filename, 'rb')
+    if rows * row_length(metadata) == 0:
+        file.close()
+        return metadata, rows, memoryview(array.array('q')), lambda: None
+
+    mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    raw = memoryview(mapped)[offset:offset + rows * row_length(metadata) * _CELL_SIZE]
+    if sys.byteorder == 'big':  # mapped memory cannot be swapped in place, so copy it
+        swapped = array.array('q', raw.tobytes())
+        swapped.byteswap()
+        raw.release()
+        cells = memoryview(swapped)
+    else:
+        cells = raw.cast('q')
+
+    def close():
+        """Releases the mapped file."""
+        cells.release()
+        if sys.byteorder != 'big':
+            raw.release()
+        mapped.close()
+        file.close()
+
+    return metadata, rows, cells, close
+
+
+def iter_binary_rows(filename):
+    """
+    Yields each row of a binary result file as a list of ints.
+
+    Parameters:
+        filename - the name of a binary result file
+
+    Returns:
+        a generator of rows, each row is a list of row_length(metadata) ints
+    """
+    metadata, rows, cells, close = _open_cells(filename)
+    columns = row_length(metadata)
+    try:
+        for x in range(rows):
+            yield cells[x * columns:(x + 1) * columns].tolist()
+    finally:
+        close()
+
+
+def get_binary_column_averages(filename):
+    """
+    Calculates the column averages of a binary result file without parsing it. With NumPy
+    the matrix is summed through a memmap, otherwise each column is summed straight
+    out of the mapped memory.
+
+    Parameters:
+        filename - the name of a binary result file
+
+    Returns:
+        colavg_list - a list of all the column averages in filename, rounded like
+            file_column_averages.get_file_column_averages
+    """
+    metadata, offset, rows = read_header(filename)
+    columns = row_length(metadata)
+    if rows == 0 or columns == 0:
+        return []
+
+    if numpy is not None:
+        matrix = numpy.memmap(filename, dtype='<i8', mode='r', offset=offset, shape=(rows, columns))
+        col_sums = [int(col_sum) for col_sum in matrix.sum(axis=0, dtype=numpy.int64)]
+        del matrix  # unmaps the file
+    else:
+        metadata, rows, cells, close = _open_cells(filename)
+        col_sums = [sum(cells[y::columns]) for y in range(columns)]
+        close()
+
+    return [round(col_sum / rows) for col_sum in col_sums]
+
+
+def export_csv(filename, csv_filename):
+    """
+    Writes the counts of a binary result file out as a csv file in the layout test_function
+    uses, one comma separated line per row, after a SIZES_COMMENT line if the file records
+    a size schedule.
+
+    Parameters:
+        filename - the name of a binary result file
+        csv_filename - the name of the csv file to write
+    """
+    out_file = open(csv_filename, 'w')
+    sizes = read_header(filename)[0].get('sizes')
+    if sizes is not None:
+        out_file.write(SIZES_COMMENT + ','.join(map(str, sizes)) + '\n')
+    for row in iter_binary_rows(filename):
+        out_file.write(','.join(map(str, row)) + '\n')
+    out_file.close()
+
+
+if __name__ == '__main__':
+    # Unit testing for result_file
+    import os
+
+    import collect_function_performance_data
+    import file_column_averages
+    from counting_quad_sorts import insertion_sort
+
+    print("Unit testing result_file")
+
+    collect_function_performance_data.test_function(insertion_sort, 20, 6, seed=2019)
+    collect_function_performance_data.test_function(insertion_sort, 20, 6, seed=2019, out_format='binary')
+    print("\nHeader: " + str(read_header(insertion_sort.__name__ + EXTENSION)))
+
+    csv_averages = file_column_averages.get_file_column_averages(insertion_sort.__name__ + '.csv')
+    binary_averages = get_binary_column_averages(insertion_sort.__name__ + EXTENSION)
+    print("Averages match the csv file: " + str(csv_averages == binary_averages))
+
+    export_csv(insertion_sort.__name__ + EXTENSION, 'exported.csv')
+    file = open('exported.csv', 'r')
+    exported = file.read()
+    file.close()
+    file = open(insertion_sort.__name__ + '.csv', 'r')
+    print("Exported csv matches the csv file: " + str(exported == file.read()))
+    file.close()
+
+    os.remove('exported.csv')
+    os.remove(insertion_sort.__name__ + EXTENSION)
+    os.remove(insertion_sort.__name__ + '.csv')
@@ -0,0 +1,225 @@
+"""
+This module is the registry of the sorting algorithms the program knows about, and the
+instrumentation that lets any sort be profiled without writing count += 1 into its loops.
+
+counted(fn) turns any sort, one that sorts a list in place (like list.sort) or one that
+returns a new sorted list (like sorted), into a counting sort with the same contract as
+counting_quad_sorts: it sorts items in place and returns a count. Each element is wrapped
+in a Counted proxy whose comparisons add to a shared counter, and optionally the list is a
+SwapCountingList that counts the elements written into it.
+
+The registry maps a name to a sort and the title shown in menus. a4, batch and test_function
+look sorts up here, so registering a sort is all it takes to add it to the program:
+
+    sort_registry.register('sorted', sort_registry.counted(sorted), 'Python sorted')
+
+The four counting_quad_sorts are registered under their own names and keep their own
+hand written counts, so their files are unchanged, followed by the counting_nlogn_sorts.
+"""
+import counting_nlogn_sorts
+import counting_quad_sorts
+
+# Constants
+COUNTS = ('comparisons', 'swaps', 'operations')  # what counted() sorts can return, operations is the sum
+
+_registry = {}  # name -> (title, fn), in order of registration
+
+
+class Counted:
+    """
+    A proxy for one list element that counts every comparison made with it. The count is
+    kept in a one element list shared by all the elements of one sort.
+    """
+    __slots__ = ('value', 'counter')
+
+    def __init__(self, value, counter):
+        self.value = value
+        self.counter = counter
+
+    def __lt__(self, other):
+        self.counter[0] += 1
+        return self.value < other.value
+
+    def __gt__(self, other):
+        self.counter[0] += 1
+        return self.value > other.value
+
+    def __le__(self, other):
+        self.counter[0] += 1
+        return self.value <= other.value
+
+    def __ge__(self, other):
+        self.counter[0] += 1
+        return self.value >= other.value
+
+    def __eq__(self, other):
+        self.counter[0] += 1
+        return self.value == other.value
+
+    def __ne__(self, other):
+        self.counter[0] += 1
+        return self.value != other.value
+
+    __hash__ = None
+
+    def __repr__(self):
+        return 'Counted(' + repr(self.value) + ')'
+
+
+class SwapCountingList(list):
+    """
+    A list that counts the elements written into it by index, writes[0] is the count. A swap
+    is two writes. Writes made inside the list's own methods (list.sort, reverse) are not seen.
+    """
+    __slots__ = ('writes',)
+
+    def __init__(self, iterable=()):
+        list.__init__(self, iterable)
+        self.writes = [0]
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            self.writes[0] += len(value)
+        else:
+            self.writes[0] += 1
+        list.__setitem__(self, index, value)
+
+
+class CountedSort:
+    """
+    The counting sort made by counted(). It is a class rather than a closure so that it can
+    be sent to the worker processes of test_function.
+    """
+
+    def __init__(self, fn, name, counts):
+        self.__wrapped__ = fn  # inspect.getsource and result_cache see the source of fn
+        self.__name__ = name
+        self.counts = counts
+
+    def __call__(self, items):
+        """Sorts items in place with the wrapped sort and returns the chosen count."""
+        comparisons = [0]
+        proxies = [Counted(value, comparisons) for value in items]
+        if self.counts != 'comparisons':
+            proxies = SwapCountingList(proxies)
+        result = self.__wrapped__(proxies)
+        if isinstance(result, list):  # a sort like sorted, which leaves its argument alone
+            proxies = result
+        for i in range(len(proxies)):  # any mutable sequence, a memoryview takes no list slices
+            items[i] = proxies[i].value
+
+        if self.counts == 'comparisons':
+            return comparisons[0]
+        swaps = proxies.writes[0] // 2 if isinstance(proxies, SwapCountingList) else 0
+        if self.counts == 'swaps':
+            return swaps
+        return comparisons[0] + swaps
+
+    def __repr__(self):
+        return 'counted(' + getattr(self.__wrapped__, '__name__', repr(self.__wrapped__)) + ')'
+
+
+def counted(fn, name=None, counts='comparisons'):
+    """
+    Makes a counting sort out of any sort.
+
+    Parameters:
+        fn - a sort that sorts a list in place, or returns a new sorted list. Use a module
+            level function (or a builtin) if it is to run in worker processes.
+        name - the __name__ of the counting sort, which names its result files. Defaults to
+            the name of fn, followed by _<counts> unless counts is 'comparisons'
+        counts - 'comparisons' counts the comparisons between elements, 'swaps' counts the
+            swaps fn makes by index (see SwapCountingList) and 'operations' is their sum
+
+    Returns:
+        sort - a counting sort: sort(items) sorts items in place and returns the count
+    """
+    if counts not in COUNTS:
+        raise ValueError('Unknown counts: ' + str(counts))
+    if name is None:
+        name = fn.__name__ if counts == 'comparisons' else fn.__name__ + '_' + counts
+    return CountedSort(fn, name, counts)
+
+
+def register(name, fn, title=None):
+    """
+    Adds a counting sort to the registry, replacing any sort already registered as name.
+
+    Parameters:
+        name - the name the sort is looked up by
+        fn - the counting sort, see counted() to make one from any sort
+        title - the title shown in menus, defaults to name
+
+    Returns:
+        fn - so register can be used on a function as it is defined
+    """
+    _registry[name] = (title or name, fn)
+    return fn
+
+
+def get(name):
+    """Returns the sort registered as name, raises KeyError if there is none."""
+    try:
+        return _registry[name][1]
+    except KeyError:
+        raise KeyError('No sort registered as ' + repr(name)) from None
+
+
+def title(name):
+    """Returns the menu title of the sort registered as name."""
+    return _registry[name][0]
+
+
+def names():
+    """Returns the names of the registered sorts, in order of registration."""
+    return list(_registry)
+
+
+register('bubble_sort', counting_quad_sorts.bubble_sort, 'Bubble sort')
+register('insertion_sort', counting_quad_sorts.insertion_sort, 'Insertion Sort')
+register('opt_bubble_sort', counting_quad_sorts.opt_bubble_sort, 'Optimized bubble sort')
+register('selection_sort', counting_quad_sorts.selection_sort, 'Selection sort')
+register('merge_sort', counting_nlogn_sorts.merge_sort, 'Merge sort')
+register('heap_sort', counting_nlogn_sorts.heap_sort, 'Heap sort')
+register('quick_sort_first', counting_nlogn_sorts.quick_sort_first, 'Quick sort (first pivot)')
+register('quick_sort_middle', counting_nlogn_sorts.quick_sort_middle, 'Quick sort (middle pivot)')
+register('quick_sort_median_of_three', counting_nlogn_sorts.quick_sort_median_of_three,
+         'Quick sort (median of three pivot)')
+register('quick_sort_random', counting_nlogn_sorts.quick_sort_random, 'Quick sort (random pivot)')
+register('natural_merge_sort', counting_nlogn_sorts.natural_merge_sort, 'Natural merge sort')
+register('sorted', counted(sorted), 'Python sorted (comparisons)')
+
+
+if __name__ == '__main__':
+    # Unit testing for sort_registry
+    import pickle
+    import random
+
+    print("Unit testing sort_registry")
+    print("\nRegistered sorts: " + ', '.join(names()))
+
+    items = [random.random() for i in range(1000)]
+    for name in names():
+        copy = list(items)
+        count = get(name)(copy)
+        print(title(name) + ": count " + str(count) + ", sorted " + str(copy == sorted(items)))
+
+    # the instrumented bubble sort makes exactly the comparisons its hand written count says
+    def plain_bubble_sort(items):
+        switch = True
+        while switch:
+            switch = False
+            for i in range(1, len(items)):
+                if items[i] < items[i - 1]:
+                    items[i], items[i - 1] = items[i - 1], items[i]
+                    switch = True
+
+    copy = items[:200]
+    print("\nComparisons of plain bubble sort: " + str(counted(plain_bubble_sort)(copy)))
+    copy = items[:200]
+    passes = counting_quad_sorts.bubble_sort(copy)
+    print("Hand counted passes minus outer passes: " + str(passes - passes // 200))
+    print("Swaps of plain bubble sort: " + str(counted(plain_bubble_sort, counts='swaps')(items[:200])))
+
+    print("\ncounted(sorted) survives pickling: " + str(pickle.loads(pickle.dumps(get('sorted')))(items[:]) > 0))